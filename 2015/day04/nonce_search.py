@@ -0,0 +1,169 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+""" Nonce search for mining AdventCoins.
+
+The search space (0, 1, 2, ...) is split into chunks of consecutive
+numbers, and each chunk is handed to a worker in a process pool.
+As soon as a worker finds a hash with the required zeroes,
+no further chunks beyond it are handed out,
+and chunks that start after it are cancelled.
+Chunks that start before it are still allowed to finish,
+since they may contain a smaller number,
+so the answer is always the lowest matching number.
+
+Each worker hashes the secret key once, and copies that hash state
+for every number, adding only the digits of the number.
+The zeroes are checked on the raw digest bytes instead of the hex string.
+Run this file directly to benchmark the hashes per second
+against hashing the whole text and checking the hex digest. """
+
+
+import hashlib
+import os
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+
+# Numbers checked by a worker in one go
+CHUNK_SIZE = 50000
+
+
+def calculate_md5(text):
+    """Calculate the MD5 hash for the give text"""
+
+    return hashlib.md5(text.encode('utf-8')).hexdigest()
+
+
+def check_required_hash(md5_hash, zeroes):
+    """Check if the Md5 hash starts with the given number of zeroes"""
+
+    return md5_hash.startswith('0' * zeroes)
+
+
+def make_zero_check(zeroes):
+    """Create a check for leading zeroes on a raw Md5 digest
+
+    Every byte of the digest is two hex characters,
+    so the first zeroes // 2 bytes must be 0,
+    and for an odd number of zeroes the next byte
+    must have its high nibble unset (i.e. be less than 16)."""
+
+    full_bytes = zeroes // 2
+    zero_bytes = bytes(full_bytes)
+
+    if zeroes % 2 == 0:
+        return lambda digest: digest[:full_bytes] == zero_bytes
+
+    return lambda digest: (
+        digest[:full_bytes] == zero_bytes and digest[full_bytes] < 16)
+
+
+def search_range(text, zeroes, start, stop):
+    """Get the first number in [start, stop) that satisfies Md5 hash"""
+
+    # Hash the secret key once,
+    # and for each number copy that state and add only its digits.
+    prefix = hashlib.md5(text.encode('utf-8'))
+    has_zeroes = make_zero_check(zeroes)
+
+    for number in range(start, stop):
+        md5 = prefix.copy()
+        md5.update(b'%d' % number)
+        if has_zeroes(md5.digest()):
+            return number
+
+    return None
+
+
+def search_range_hex(text, zeroes, start, stop):
+    """Get the first number in [start, stop) that satisfies Md5 hash
+
+    This hashes the whole text for every number and checks the hex digest,
+    and is only kept to compare against in benchmark."""
+
+    for number in range(start, stop):
+        if check_required_hash(calculate_md5(text + str(number)), zeroes):
+            return number
+
+    return None
+
+
+def find_nonce(text, zeroes, workers=None, chunk_size=CHUNK_SIZE):
+    """Get the lowest number whose Md5 hash has the required zeroes
+
+    workers is the number of processes to use,
+    and defaults to the number of CPUs.
+    With a single worker, the chunks are searched in this process."""
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Without extra workers, search the chunks in order
+    # and return the first hit.
+    if workers <= 1:
+        start = 0
+        while True:
+            number = search_range(text, zeroes, start, start + chunk_size)
+            if number is not None:
+                return number
+            start += chunk_size
+
+    # Keep twice as many chunks in flight as there are workers,
+    # so that no worker sits idle while results are collected.
+    # pending maps each future to the start of its chunk.
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = {}
+    next_start = 0
+    answer = None
+    try:
+        while True:
+            # Hand out more chunks while no answer has been found
+            while answer is None and len(pending) < 2 * workers:
+                future = executor.submit(
+                    search_range, text, zeroes,
+                    next_start, next_start + chunk_size)
+                pending[future] = next_start
+                next_start += chunk_size
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                del pending[future]
+                number = future.result()
+                if number is not None and (answer is None or number < answer):
+                    answer = number
+
+            # Chunks that start after the answer can not improve it
+            if answer is not None:
+                for future, start in list(pending.items()):
+                    if start > answer:
+                        future.cancel()
+                        del pending[future]
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return answer
+
+
+def benchmark(text='ckczppom', count=500000):
+    """Print the hashes per second of the hex and prefix hashing paths"""
+
+    from timeit import default_timer
+
+    # Search for more zeroes than any hash in the range will have,
+    # so that both paths check every number.
+    for name, search in (
+            ('hexdigest', search_range_hex), ('prefix copy', search_range)):
+        start = default_timer()
+        search(text, 32, 0, count)
+        elapsed = default_timer() - start
+        print('{name}: {rate:.0f} hashes/s'.format(
+            name=name, rate=count / elapsed))
+
+
+if __name__ == '__main__':
+
+    benchmark()
@@ -31,42 +31,22 @@ that is, the MD5 hash of pqrstuv1048970 looks like 000006136ef....
 Now find one that starts with six zeroes. """
 
 
-def calculate_md5(text):
-    """Calculate the MD5 hash for the give text"""
+from nonce_search import find_nonce
 
-    import hashlib
-    return hashlib.md5(text.encode('utf-8')).hexdigest()
 
+def get_answer(filename, workers=None):
+    """Get answer for which number satisfies Md5 hash
 
-def check_required_hash(md5_hash):
-    """Check if the Md5 hash satisfies the required conditions"""
-
-    # Check if MD5 hash starts with 6 zeroes
-    if md5_hash.find('000000') == 0:
-        return True
-    return False
-
-
-def get_answer(filename):
-    """Get answer for which number satisfies Md5 hash"""
+    workers is the number of processes used for the search,
+    and defaults to the number of CPUs."""
 
     # Read text from file
     with open(filename, 'r') as f:
         text = f.readline().strip()
 
-    # Set starting number to 0.
-    # Calculate MD5 hash for each number, and check
-    # if it satisfies the required condition.
-    # Increment number otherwise.
-    number = 0
-    while True:
-        md5_hash = calculate_md5(text + str(number))
-        if check_required_hash(md5_hash):
-            break
-        else:
-            number += 1
-
-    return number
+    # Search numbers in chunks spread over the workers,
+    # and get the lowest number whose hash starts with 6 zeroes.
+    return find_nonce(text, 6, workers=workers)
 
 
 if __name__ == '__main__':
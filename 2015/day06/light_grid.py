@@ -0,0 +1,272 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+""" Light grid for following Santa's lighting instructions.
+
+Every instruction changes a rectangle of lights, so instead of
+changing the lights one at a time, the grid changes each row
+of the rectangle as one slice:
+with numpy, the whole rectangle is a single slice of a 2D array,
+and without it, each row is an array of ints whose slice
+is replaced in one go.
+
+The rules say what each command does to a light:
+SWITCH for turning lights on and off (part 1),
+and BRIGHTNESS for changing their brightness (part 2).
+Every rule is an operation and a value:
+'set' sets the lights to the value, 'xor' flips the bits in the value,
+and 'add' adds the value, never going below zero.
+
+BitGrid keeps lights that are only on or off as one bit each,
+with every row a single int, so each instruction is one masked
+OR, AND-NOT or XOR for each row in its rectangle,
+and counting the lit lights is a popcount of each row.
+Run this file directly to benchmark it against a list of lists.
+
+With compressed, the grid only has a cell for every distinct
+rectangle formed by the edges in the instructions,
+and each cell counts for as many lights as it covers.
+That makes the work depend on the number of instructions,
+and not on the size of the grid. """
+
+
+import re
+from array import array
+from operator import mul
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Rules for part 1, lights are either on (1) or off (0)
+SWITCH = {
+    'turn on': ('set', 1),
+    'turn off': ('set', 0),
+    'toggle': ('xor', 1),
+}
+
+# Rules for part 2, lights have a brightness of zero or more
+BRIGHTNESS = {
+    'turn on': ('add', 1),
+    'turn off': ('add', -1),
+    'toggle': ('add', 2),
+}
+
+PATTERN = re.compile(
+    r'^([a-zA-Z]+ *[a-zA-Z]*) (\d+),(\d+) through (\d+),(\d+)', re.MULTILINE)
+
+
+def read_instructions(filename):
+    """Read instructions as (command, start_x, start_y, end_x, end_y)"""
+
+    with open(filename, 'r') as f:
+        text = f.read()
+
+    return [
+        (command, int(start_x), int(start_y), int(end_x), int(end_y))
+        for command, start_x, start_y, end_x, end_y
+        in PATTERN.findall(text)]
+
+
+class LightGrid(object):
+
+    """Grid of lights where instructions change rectangles of lights
+
+    x_weights and y_weights are the number of lights each cell
+    covers along x and y, and are all 1 for a grid of single lights."""
+
+    def __init__(self, rules, x_weights, y_weights, use_numpy=True):
+        self.rules = rules
+        self.x_weights = x_weights
+        self.y_weights = y_weights
+        self.use_numpy = use_numpy and numpy is not None
+
+        if self.use_numpy:
+            self.lights = numpy.zeros(
+                (len(x_weights), len(y_weights)), dtype=numpy.int64)
+        else:
+            self.lights = [
+                array('q', bytes(8 * len(y_weights)))
+                for _ in x_weights]
+
+    def apply(self, command, start_x, start_y, end_x, end_y):
+        """Apply command to the lights from start to end, inclusive"""
+
+        operation, value = self.rules[command]
+
+        if self.use_numpy:
+            lights = self.lights[start_x:end_x + 1, start_y:end_y + 1]
+            if operation == 'set':
+                lights[...] = value
+            elif operation == 'xor':
+                lights ^= value
+            else:
+                lights += value
+                if value < 0:
+                    numpy.maximum(lights, 0, out=lights)
+            return
+
+        width = end_y - start_y + 1
+        if operation == 'set':
+            # Every row gets the same slice of values
+            values = array('q', [value]) * width
+            for row in self.lights[start_x:end_x + 1]:
+                row[start_y:end_y + 1] = values
+            return
+
+        for row in self.lights[start_x:end_x + 1]:
+            lights = row[start_y:end_y + 1]
+            if operation == 'xor':
+                changed = [light ^ value for light in lights]
+            elif value < 0:
+                changed = [
+                    light + value if light > -value else 0
+                    for light in lights]
+            else:
+                changed = [light + value for light in lights]
+            row[start_y:end_y + 1] = array('q', changed)
+
+    def total(self):
+        """Get the total of all lights, counting each cell by its weight"""
+
+        if self.use_numpy:
+            weights = numpy.outer(
+                numpy.array(self.x_weights, dtype=numpy.int64),
+                numpy.array(self.y_weights, dtype=numpy.int64))
+            return int((self.lights * weights).sum())
+
+        return sum(
+            x_weight * sum(map(mul, row, self.y_weights))
+            for x_weight, row in zip(self.x_weights, self.lights))
+
+
+class BitGrid(object):
+
+    """Grid of lights that are on or off, one bit per light
+
+    Row x is an int whose bit y is light (x, y),
+    so a rectangle is the same mask of bits on each of its rows.
+    Only the SWITCH rules can be applied to it."""
+
+    def __init__(self, size):
+        self.lights = [0] * size
+
+    def apply(self, command, start_x, start_y, end_x, end_y):
+        """Apply command to the lights from start to end, inclusive"""
+
+        operation, value = SWITCH[command]
+        mask = ((1 << (end_y - start_y + 1)) - 1) << start_y
+        lights = self.lights
+
+        if operation == 'xor':
+            for x in range(start_x, end_x + 1):
+                lights[x] ^= mask
+        elif value:
+            for x in range(start_x, end_x + 1):
+                lights[x] |= mask
+        else:
+            mask = ~mask
+            for x in range(start_x, end_x + 1):
+                lights[x] &= mask
+
+    def total(self):
+        """Get the number of lit lights"""
+
+        return sum(map(popcount, self.lights))
+
+
+def popcount(bits):
+    """Count the set bits in bits"""
+
+    return bin(bits).count('1')
+
+
+# int.bit_count is only available from python 3.10
+if hasattr(int, 'bit_count'):
+    popcount = int.bit_count
+
+
+def compress(edges):
+    """Get the sorted distinct edges, and the width between each of them"""
+
+    edges = sorted(set(edges))
+    widths = [end - start for start, end in zip(edges, edges[1:])]
+
+    return edges, widths
+
+
+def get_total(
+        instructions, rules, size=1000, compressed=False, use_numpy=True):
+    """Get the total of all lights after following the instructions"""
+
+    if not compressed:
+        grid = LightGrid(rules, [1] * size, [1] * size, use_numpy)
+        for instruction in instructions:
+            grid.apply(*instruction)
+        return grid.total()
+
+    # Every rectangle starts at its start, and ends just before end + 1,
+    # so these edges split the grid into cells that always
+    # change together. The edges of the grid are added
+    # so that the cells cover the whole grid.
+    x_edges, x_weights = compress(
+        [0, size]
+        + [x for _, start_x, _, end_x, _ in instructions
+           for x in (start_x, end_x + 1)])
+    y_edges, y_weights = compress(
+        [0, size]
+        + [y for _, _, start_y, _, end_y in instructions
+           for y in (start_y, end_y + 1)])
+    x_cells = {x: cell for cell, x in enumerate(x_edges)}
+    y_cells = {y: cell for cell, y in enumerate(y_edges)}
+
+    grid = LightGrid(rules, x_weights, y_weights, use_numpy)
+    for command, start_x, start_y, end_x, end_y in instructions:
+        grid.apply(
+            command, x_cells[start_x], y_cells[start_y],
+            x_cells[end_x + 1] - 1, y_cells[end_y + 1] - 1)
+
+    return grid.total()
+
+
+def benchmark(filename='./input.txt'):
+    """Print the time and memory of part 1 with a list of lists and BitGrid"""
+
+    import sys
+    from timeit import default_timer
+
+    instructions = read_instructions(filename)
+
+    # The lights as a list of lists of booleans, one light at a time
+    start = default_timer()
+    lights = [[False] * 1000 for _ in range(1000)]
+    for command, start_x, start_y, end_x, end_y in instructions:
+        for x in range(start_x, end_x + 1):
+            row = lights[x]
+            for y in range(start_y, end_y + 1):
+                if command == 'toggle':
+                    row[y] = not row[y]
+                else:
+                    row[y] = command == 'turn on'
+    lit = sum(row.count(True) for row in lights)
+    elapsed = default_timer() - start
+    memory = sys.getsizeof(lights) + sum(map(sys.getsizeof, lights))
+    print('list of lists: {lit} lit, {elapsed:.3f}s, {memory} bytes'.format(
+        lit=lit, elapsed=elapsed, memory=memory))
+
+    start = default_timer()
+    grid = BitGrid(1000)
+    for instruction in instructions:
+        grid.apply(*instruction)
+    lit = grid.total()
+    elapsed = default_timer() - start
+    memory = sys.getsizeof(grid.lights) + sum(map(sys.getsizeof, grid.lights))
+    print('bit grid: {lit} lit, {elapsed:.3f}s, {memory} bytes'.format(
+        lit=lit, elapsed=elapsed, memory=memory))
+
+
+if __name__ == '__main__':
+
+    benchmark()
@@ -37,9 +37,17 @@ After following the instructions, how many lights are lit?
 #include <stdlib.h>
 #include <string.h>
 #include <stdbool.h>
+#include <stdint.h>
 #include <regex.h>
 
 
+// Lights are stored one bit per light, each row as 16 words of 64 bits.
+// Light (x, y) is bit (y % 64) of word (y / 64) in row x.
+#define GRID_SIZE 1000
+#define WORD_BITS 64
+#define ROW_WORDS ((GRID_SIZE + WORD_BITS - 1) / WORD_BITS)
+
+
 typedef enum {OFF, ON, TOGGLE} Command;
 
 const char* commands[] = {
@@ -53,6 +61,32 @@ regex_t r_compiled;
 
 
 
+/**
+ * Mask of the bits from start to end (inclusive) that fall in a word
+ * @param  word  index of the word in the row
+ * @param  start first light in the row
+ * @param  end   last light in the row
+ * @return uint64_t mask with the bits of the lights in the word set
+ */
+uint64_t word_mask(long word, long start, long end)
+{
+    long first = word * WORD_BITS;  // first light in the word
+    long last = first + WORD_BITS - 1;  // last light in the word
+    uint64_t mask = ~(uint64_t)0;
+
+    if (end < first || start > last) {
+        return 0;
+    }
+    if (start > first) {
+        mask &= ~(uint64_t)0 << (start - first);
+    }
+    if (end < last) {
+        mask &= ~(uint64_t)0 >> (last - end);
+    }
+    return mask;
+}
+
+
 Command parse_command(char* line)
 {
     if (strstr(line, "toggle")) {
@@ -80,15 +114,15 @@ int main(int argc, char** argv)
     char result[256];  // buffer to hold match
     char* end;  // end pointer used in string conversions
 
-    // false: OFF; true: ON
-    // also works with enum Command
-    bool lights[1000][1000] = { false };  // lights 2D array
+    // bit unset: OFF; bit set: ON
+    uint64_t lights[GRID_SIZE][ROW_WORDS] = { { 0 } };  // packed lights
+    uint64_t mask = 0;  // bits of the lights in a word to change
 
     long start_pos[2];  // starting position of command
     long end_pos[2];  // ending position of command
 
     long i = 0;  // temp ; x-axis
-    long j = 0;  // temp ; y-axis
+    long j = 0;  // temp ; word in row
 
     long lights_on = 0;  // counter for lights that are on
 
@@ -136,26 +170,25 @@ int main(int argc, char** argv)
         len = pm[5].rm_eo - pm[5].rm_so;
         end_pos[1] = strtol(line + pm[5].rm_so, &end, 10);
 
-        // Set lights on or off
-        for (i=start_pos[0]; i<=end_pos[0]; i++) {
-            for (j=start_pos[1]; j<=end_pos[1]; j++) {
+        // Set lights on or off, a word of the row at a time
+        for (j=start_pos[1] / WORD_BITS; j<=end_pos[1] / WORD_BITS; j++) {
+            mask = word_mask(j, start_pos[1], end_pos[1]);
+            for (i=start_pos[0]; i<=end_pos[0]; i++) {
                 if (command == OFF) {
-                    lights[i][j] = OFF;
+                    lights[i][j] &= ~mask;
                 } else if (command == ON) {
-                    lights[i][j] = ON;
+                    lights[i][j] |= mask;
                 } else if (command == TOGGLE) {
-                    lights[i][j] = !lights[i][j];
+                    lights[i][j] ^= mask;
                 }
             }
         }
     }
 
-    // Calculate no of lights that are ON
-    for (i=0, lights_on=0; i<1000; i++) {
-        for (j=0; j<1000; j++) {
-            if (lights[i][j] == ON) {
-                lights_on += 1;
-            }
+    // Calculate no of lights that are ON by counting set bits
+    for (i=0, lights_on=0; i<GRID_SIZE; i++) {
+        for (j=0; j<ROW_WORDS; j++) {
+            lights_on += __builtin_popcountll(lights[i][j]);
         }
     }
     printf("%ld\n", lights_on);
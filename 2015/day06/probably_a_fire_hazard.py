@@ -35,39 +35,30 @@ turn off 499,499 through 500,500 would turn off
 After following the instructions, how many lights are lit? """
 
 
-def get_answer(filename):
-    """Get the number of lit lights"""
-
-    # Set up lights as a 2D matrix of boolean values,
-    # with True representing ON and False representing OFF.
-    # The lights are OFF at start (False).
-    lights = [[False for x in range(0, 1000)] for x in range(0, 1000)]
-
-    # The commands for managing light.
-    commands = {
-        'toggle': lambda x, y: not lights[x][y],
-        'turn off': lambda x, y: False,
-        'turn on': lambda x, y: True,
-    }
-
-    # Use regex to parse the line and get commands and light ranges.
-    import re
-    pattern = r'^([a-zA-Z]+ *[a-zA-Z]*) (\d+),(\d+) through (\d+),(\d+)'
-
-    # Iterate over each line in the input, parse it,
-    # and use the commands dictionary
-    # to apply the operation on the lights matrix.
-    with open(filename, 'r') as f:
-        for line in f.readlines():
-            parsed = re.match(pattern, line)
-            command, start_x, start_y, end_x, end_y = parsed.groups()
-            for x in range(int(start_x), int(end_x) + 1):
-                for y in range(int(start_y), int(end_y) + 1):
-                    lights[x][y] = commands[command](x, y)
-
-    # Return count of all lights that are ON (True) in the 2D matrix
-    # by adding all counts in each 1D matrix.
-    return sum([x.count(True) for x in lights])
+from light_grid import BitGrid
+from light_grid import SWITCH
+from light_grid import get_total
+from light_grid import read_instructions
+
+
+def get_answer(filename, compressed=False):
+    """Get the number of lit lights
+
+    With compressed, the lights are grouped into the rectangles
+    formed by the instructions, instead of a cell for every light."""
+
+    instructions = read_instructions(filename)
+    if compressed:
+        return get_total(instructions, SWITCH, compressed=True)
+
+    # Keep every row of lights as the bits of an int,
+    # apply every instruction as a mask on each row in its rectangle,
+    # then count the bits that are set.
+    grid = BitGrid(1000)
+    for instruction in instructions:
+        grid.apply(*instruction)
+    return grid.total()
+
 
 if __name__ == '__main__':
 
@@ -62,36 +62,22 @@ toggle 0,0 through 999,999 would increase the total brightness
 by 2000000. """
 
 
-def get_answer(filename):
-    """Get the number of lit lights"""
-
-    # Set up lights as a 2D matrix of int values, starting at 0.
-    lights = [[0 for x in range(0, 1000)] for x in range(0, 1000)]
-
-    # The commands for managing light.
-    commands = {
-        'toggle': lambda x: x + 2,
-        'turn off': lambda x: x - 1 if x > 0 else 0,
-        'turn on': lambda x: x + 1,
-    }
-
-    # Use regex to parse the line and get commands and light ranges.
-    import re
-    pattern = r'^([a-zA-Z]+ *[a-zA-Z]*) (\d+),(\d+) through (\d+),(\d+)'
-
-    # Iterate over each line in the input, parse it,
-    # and use the commands dictionary
-    # to apply the operation on the lights matrix.
-    with open(filename, 'r') as f:
-        for line in f.readlines():
-            parsed = re.match(pattern, line)
-            command, start_x, start_y, end_x, end_y = parsed.groups()
-            for x in range(int(start_x), int(end_x) + 1):
-                for y in range(int(start_y), int(end_y) + 1):
-                    lights[x][y] = commands[command](lights[x][y])
-
-    # Return total brightness by a summation of all values in the 2D array.
-    return sum([sum(x) for x in lights])
+from light_grid import BRIGHTNESS
+from light_grid import get_total
+from light_grid import read_instructions
+
+
+def get_answer(filename, compressed=False):
+    """Get the total brightness of all lights
+
+    With compressed, the lights are grouped into the rectangles
+    formed by the instructions, instead of a cell for every light."""
+
+    # Apply every instruction to its rectangle of lights in one go,
+    # then add up the lights.
+    instructions = read_instructions(filename)
+    return get_total(instructions, BRIGHTNESS, compressed=compressed)
+
 
 if __name__ == '__main__':
 
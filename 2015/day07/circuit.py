@@ -0,0 +1,268 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+""" Compiled evaluation of a circuit of wires.
+
+Instead of resolving wires through a stack until every input has
+a signal, the circuit is compiled once into a flat list of instructions
+in which every wire comes after the wires it takes as inputs.
+Running the circuit is then a single pass over the instructions.
+
+Every wire, and every number used as an input, gets a slot
+in a list of signals. Each instruction is four ints:
+the opcode of its gate, the slot it writes to,
+and the slots of its two inputs (the second is unused by
+EXTEND and NOT). Wires given a signal directly have no instruction,
+their signal is stored in their slot before running.
+
+A circuit in which a wire depends on its own signal can not be solved,
+and compiling it raises CircuitCycleError naming the wires in the cycle.
+
+Circuit keeps the signals of a solved circuit, and setting the signal
+of a wire solves again only the wires downstream of it,
+found through the outputs each wire keeps of the wires depending on it.
+
+tokenize reads every kind of instruction with one compiled pattern,
+in a single pass over the whole text. """
+
+
+import re
+from array import array
+from collections import deque
+
+# Opcodes for the gates, EXTEND passes the signal of a wire on
+EXTEND, NOT, AND, OR, LSHIFT, RSHIFT = range(6)
+
+OPCODES = {
+    None: EXTEND,
+    'NOT': NOT,
+    'AND': AND,
+    'OR': OR,
+    'LSHIFT': LSHIFT,
+    'RSHIFT': RSHIFT,
+}
+
+# Signals are 16bit numbers
+MASK = 0xFFFF
+
+# Every kind of instruction, as alternatives of one pattern.
+# The alternatives are tried in order, and each has to be followed
+# by the arrow, so a line can only ever match one of them.
+INSTRUCTION = re.compile(r'''
+    ^(?:
+        (?P<input_a>\w+)\ (?P<gate>AND|OR|LSHIFT|RSHIFT)\ (?P<input_b>\w+)
+        | NOT\ (?P<not_input>\w+)
+        | (?P<signal>\d+)
+        | (?P<wire>[a-z]+)
+    )\ ->\ (?P<name>[a-z]+)[ \t]*$
+    ''', re.MULTILINE | re.VERBOSE)
+
+
+class CircuitCycleError(ValueError):
+
+    """Raised when the signal of a wire depends on itself"""
+
+    def __init__(self, cycle):
+        self.cycle = cycle
+        super(CircuitCycleError, self).__init__(
+            'wires form a cycle: {cycle}'.format(cycle=' -> '.join(cycle)))
+
+
+class Program(object):
+
+    """Compiled circuit, ready to be run"""
+
+    def __init__(self, slots, signals, code, offsets):
+        # slot of each wire, by name
+        # wires are given slots in the order they are solved
+        self.slots = slots
+        # signals to start running with,
+        # filled in for numbers and wires with a given signal
+        self.signals = signals
+        # opcode, output slot, input slots; four ints per instruction
+        self.code = code
+        # where the instruction of each slot starts in code
+        self.offsets = offsets
+
+
+def tokenize(text):
+    """Yield (name, signal, gate, input_a, input_b) for each instruction
+
+    Parts that an instruction does not have are None."""
+
+    for (input_a, gate, input_b, not_input, signal, wire,
+            name) in INSTRUCTION.findall(text):
+        if gate:
+            yield name, None, gate, input_a, input_b
+        elif not_input:
+            yield name, None, 'NOT', not_input, None
+        elif signal:
+            yield name, signal, None, None, None
+        else:
+            yield name, None, None, wire, None
+
+
+def find_cycle(unsolved):
+    """Find wires that form a cycle among the unsolved wires
+
+    Every unsolved wire has an unsolved input,
+    so following them must eventually come back to a wire seen before."""
+
+    wire = next(iter(unsolved.values()))
+    path = []
+    seen = {}
+    while wire.name not in seen:
+        seen[wire.name] = len(path)
+        path.append(wire.name)
+        wire = next(
+            x for x in wire.inputs
+            if not isinstance(x, int) and x.name in unsolved)
+
+    # The cycle in the direction the signal flows
+    cycle = path[seen[wire.name]:] + [wire.name]
+    cycle.reverse()
+    return cycle
+
+
+def topological_order(wires):
+    """Order wires so that each wire comes after all of its inputs"""
+
+    # Count the wire inputs of each wire
+    waiting = {
+        wire.name: sum(1 for x in wire.inputs if not isinstance(x, int))
+        for wire in wires.values()}
+
+    # Start with the wires with no wire inputs,
+    # and once all inputs of a wire are ordered, it can follow them.
+    ready = deque(wire for wire in wires.values() if not waiting[wire.name])
+    order = []
+    while ready:
+        wire = ready.popleft()
+        order.append(wire)
+        for output in wire.outputs:
+            waiting[output.name] -= 1
+            if not waiting[output.name]:
+                ready.append(output)
+
+    # Wires that were never ready are waiting on a cycle
+    if len(order) < len(wires):
+        ordered = set(wire.name for wire in order)
+        raise CircuitCycleError(find_cycle({
+            name: wire for name, wire in wires.items()
+            if name not in ordered}))
+
+    return order
+
+
+def compile_circuit(wires):
+    """Compile linked wires into a Program"""
+
+    order = topological_order(wires)
+
+    # A slot for every wire, followed by a slot for every number
+    slots = {wire.name: slot for slot, wire in enumerate(order)}
+    signals = [None] * len(order)
+    numbers = {}
+
+    def input_slot(x):
+        """Get the slot of an input, adding a slot for new numbers"""
+
+        if not isinstance(x, int):
+            return slots[x.name]
+        if x not in numbers:
+            numbers[x] = len(signals)
+            signals.append(x & MASK)
+        return numbers[x]
+
+    code = array('l')
+    offsets = {}
+    for wire in order:
+        slot = slots[wire.name]
+        # Wires given a signal directly have no instruction
+        if not wire.inputs:
+            signals[slot] = int(wire.signal) & MASK
+            continue
+        input_a = input_slot(wire.inputs[0])
+        input_b = input_slot(wire.inputs[-1])
+        offsets[slot] = len(code)
+        code.extend((OPCODES[wire.gate], slot, input_a, input_b))
+
+    return Program(slots, signals, code, offsets)
+
+
+def run_circuit(program):
+    """Run the instructions in order, and get the signal of every slot"""
+
+    signals = list(program.signals)
+    execute(program.code, signals)
+
+    return signals
+
+
+def execute(code, signals):
+    """Run the instructions in code, updating signals in place"""
+
+    # Take the instructions four ints at a time
+    code = iter(code)
+    for opcode, output, input_a, input_b in zip(code, code, code, code):
+        if opcode == AND:
+            signals[output] = signals[input_a] & signals[input_b]
+        elif opcode == OR:
+            signals[output] = signals[input_a] | signals[input_b]
+        elif opcode == NOT:
+            signals[output] = ~signals[input_a] & MASK
+        elif opcode == LSHIFT:
+            signals[output] = (signals[input_a] << signals[input_b]) & MASK
+        elif opcode == RSHIFT:
+            signals[output] = signals[input_a] >> signals[input_b]
+        else:
+            signals[output] = signals[input_a]
+
+
+class Circuit(object):
+
+    """Solved circuit where the signal of any wire can be set
+
+    Setting a signal solves again only the wires downstream of the wire,
+    in the order of their slots, which is the order they are solved in.
+    A wire that has been set keeps its signal, and does not change
+    when wires upstream of it are set later."""
+
+    def __init__(self, wires):
+        self.wires = wires
+        self.program = compile_circuit(wires)
+        self.signals = run_circuit(self.program)
+        # slots of wires that have been set
+        self.fixed = set()
+
+    def __getitem__(self, name):
+        return self.signals[self.program.slots[name]]
+
+    def set_signal(self, name, signal):
+        """Set the signal of a wire, and solve the wires depending on it"""
+
+        slots = self.program.slots
+        slot = slots[name]
+        self.signals[slot] = signal & MASK
+        self.fixed.add(slot)
+
+        # Find the wires downstream of the wire,
+        # stopping at wires that have been set
+        downstream = set()
+        stack = list(self.wires[name].outputs)
+        while stack:
+            wire = stack.pop()
+            output_slot = slots[wire.name]
+            if output_slot in downstream or output_slot in self.fixed:
+                continue
+            downstream.add(output_slot)
+            stack.extend(wire.outputs)
+
+        # Run their instructions in the order they were compiled
+        code = self.program.code
+        offsets = self.program.offsets
+        cone = array('l')
+        for output_slot in sorted(downstream):
+            offset = offsets[output_slot]
+            cone.extend(code[offset:offset + 4])
+        execute(cone, self.signals)
@@ -64,9 +64,12 @@ what signal is ultimately provided to wire a? """
 
 
 import logging
-import re
 import sys
 
+from circuit import compile_circuit
+from circuit import run_circuit
+from circuit import tokenize
+
 # Set log output to console / stdout
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -90,6 +93,8 @@ class Wire(object):
         self.inputs = []
         # gate in the circuit
         self.gate = None
+        # wires that take this wire as an input
+        self.outputs = []
 
     def __str__(self):
         return self.name
@@ -119,43 +124,20 @@ def parse_circuit(
 def make_wires(filename):
     """Create wires from input file"""
 
-    # Input patterns and group names.
-    #
-    # The input patterns are regular expressions
-    # that identify the type of statement.
-    # The associated tuple contains the groups names for the regex
-    # which is used to pass the extracted groups as keyword arguments
-    # to the parse_circuit function to create wire objects.
-    patterns = {
-        # extend wire
-        r'^([a-z]+) -> (\w+)': ('input_a', 'name'),
-        # signal
-        r'^(\d+) -> (\w+)': ('signal', 'name'),
-        # single input gate
-        r'^(\w+) (\w+) -> (\w+)': ('gate', 'input_a', 'name'),
-        # double input gate
-        r'^(\w+) (\w+) (\w+) -> (\w+)': ('input_a', 'gate', 'input_b', 'name'),
-    }
+    # Read the whole file at once,
+    # and let the tokenizer match every instruction in one pass
+    # with a single pattern for all the types of statements.
+    with open(filename, 'r') as f:
+        text = f.read()
 
     # the dictionary will hold wire / circuits
     # identified by their name
     wires = {}
 
-    # iterate over each line in the file,
-    # match regex expressions, extract groups,
-    # pass to parse_circuit function as keyword arguments
+    # pass the parts of each instruction to parse_circuit
     # and save the wire object to wires dict
-    with open(filename, 'r') as f:
-        for line in f.readlines():
-            for pattern, kwargs in patterns.items():
-                matches = re.match(pattern, line)
-                if matches is not None:
-                    # assign extracted groups to keywords
-                    # from matched patterns,
-                    # then construct dict to be unpacked as
-                    # keyword arguments
-                    wire = parse_circuit(**dict(zip(kwargs, matches.groups())))
-                    wires[wire.name] = wire
+    for name, signal, gate, input_a, input_b in tokenize(text):
+        wires[name] = parse_circuit(name, signal, gate, input_a, input_b)
 
     return wires
 
@@ -170,138 +152,20 @@ def link_wires(wires):
         # Set inputs to empty list
         inputs = []
         # For each input,
-        # try to parse it as an int,
-        # if it can't be (ValueError), it's a wire object,
+        # if it is made of digits, it's a signal,
+        # otherwise it's a wire object,
         # therefore, link it to the wire object in dict
         for name in wire.inputs:
-            try:
-                value = int(name)
-                inputs.append(value)
-            except ValueError:
+            if name.isdigit():
+                inputs.append(int(name))
+            else:
                 inputs.append(wires[name])
+                # track the wire as depending on its input
+                wires[name].outputs.append(wire)
 
         wire.inputs = inputs
 
 
-def get_input(input_obj, wires):
-    """Get input signal for input_obj from wires if required"""
-
-    if input_obj is None:
-        return None
-
-    # If the input is a signal, return it back
-    if type(input_obj) == int:
-        return input_obj
-
-    # If the input is a wire, resolve it until we get a signal
-    if type(input_obj) == Wire:
-        input_obj = wires[input_obj.name]
-
-    return input_obj
-
-
-def solve_gate(wire, wires):
-    """Solve the circuit formed by this wire and its gate"""
-
-    # Always keep the result as a 16bit number
-    m16 = lambda x: x & 0xFFFF
-
-    # Extending wires have no gates
-    if wire.gate is None:
-        wire.signal = get_input(wire.inputs[0], wires)
-        logger.debug(
-            '{name} = EXTEND {signal}'.format(
-                name=wire.name, signal=wire.signal))
-    # NOT gates have only one input
-    elif wire.gate == 'NOT':
-        x = get_input(wire.inputs[0], wires)
-        wire.signal = m16(~x)
-        logger.debug(
-            '{name} = NOT {x} = {signal}'.format(
-                name=wire.name, x=x, signal=wire.signal))
-    # All the other gates have two inputs
-    else:
-        # Get the two inputs as x, y
-        x = get_input(wire.inputs[0], wires)
-        y = get_input(wire.inputs[1], wires)
-
-        if wire.gate == 'AND':
-            wire.signal = m16(x & y)
-            logger.debug(
-                '{name} = {x} AND {y} = {signal}'.format(
-                    name=wire.name, x=x, y=y, signal=wire.signal))
-
-        elif wire.gate == 'OR':
-            wire.signal = m16(x | y)
-            logger.debug(
-                '{name} = {x} OR {y} = {signal}'.format(
-                    name=wire.name, x=x, y=y, signal=wire.signal))
-
-        elif wire.gate == 'LSHIFT':
-            wire.signal = m16(x << y)
-            logger.debug(
-                '{name} = {x} LSHIFT {y} = {signal}'.format(
-                    name=wire.name, x=x, y=y, signal=wire.signal))
-
-        elif wire.gate == 'RSHIFT':
-            wire.signal = m16(x >> y)
-            logger.debug(
-                '{name} = {x} RSHIFT {y} = {signal}'.format(
-                    name=wire.name, x=x, y=y, signal=wire.signal))
-
-
-def solve_circuit(wires, end_point):
-    """Solve the circuit formed by the wires with end_point"""
-
-    # Create stack using a list with the end_point in it.
-    # Iterate over the stack until it is empty.
-    #
-    # At each iteration, pop the wire off the stack,
-    # and check if it has any wire inputs.
-    # If it does, push it back on the stack,
-    # and push all its wire inputs on the stack.
-    #
-    # If the wire has only signal inputs, solve the gate
-    # and save the signal in the dictionary
-    #
-    # At the end, the entire circuit will have been sovled,
-    # assuming that it is a valid circuit, and the stack
-    # should be empty.
-    stack = [end_point]
-
-    while(stack):
-
-        # uncomment the next line to see a step-by-step operation on the stack
-        # logger.debug('stack:{stack}'.format(stack=stack))
-
-        # pop a wire off the stack
-        wire = stack.pop()
-
-        # If it does not have any inputs nor any gates,
-        # then it has a signal.
-        if not wire.inputs and not wire.gate:
-            wires[wire.name] = int(wire.signal)
-            logger.debug(
-                '{name} = {signal}'.format(
-                    name=wire.name, signal=wire.signal))
-            continue
-
-        # Check how many other wires are attached as inputs
-        wire_inputs = [
-            x for x in wire.inputs
-            if type(x) != int and type(wires[x.name]) == Wire]
-
-        # If there are any, push the wire on the stack,
-        # then push its wire inputs on the stack.
-        if wire_inputs:
-            stack.append(wire)
-            stack.extend(wire_inputs)
-        # Otherwise, solve the wire and save its signal
-        else:
-            solve_gate(wire, wires)
-            wires[wire.name] = wire.signal
-
-
 def get_answer(filename, target_wire):
     """Get signal for wire a"""
 
@@ -312,22 +176,16 @@ def get_answer(filename, target_wire):
     link_wires(wires)
 
     # set target wire from the dict with given name
-    target_wire = wires.get(target_wire)
-    if target_wire is None:
+    if target_wire not in wires:
         logger.critical('Target wire not specified.')
         return None
 
-    solve_circuit(wires, end_point=target_wire)
-
-    # Unsolved wires are those who are still present
-    # in the wires dict as Wire objects
-    logger.debug(
-        'Wires unsolved: {unsolved}'.format(
-            unsolved=[
-                x for x, y in wires.items()
-                if type(y) != int]))
+    # compile the circuit into instructions ordered so that
+    # every wire comes after its inputs, and run them in one pass
+    program = compile_circuit(wires)
+    signals = run_circuit(program)
 
-    return wires[target_wire.name]
+    return signals[program.slots[target_wire]]
 
 
 if __name__ == '__main__':
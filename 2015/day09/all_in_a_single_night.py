@@ -40,23 +40,26 @@ What is the distance of the shortest route? """
 # The variation is -
 # Santa does not have to come back to the starting position.
 #
-# The approach taken in this solutino is BRUTE FORCE.
-# It calculates all possible paths for permutations of cities,
-# calculcates their distances, and finds the route with the shortest distance.
+# The approach taken in this solution is the Held-Karp algorithm.
+# It numbers the cities, builds a matrix of distances between them,
+# and for every set of cities finds the shortest route through
+# them ending at each city, by extending the routes through smaller sets.
 #
-# This runs in n! time since for each permutation,
-# there are n! possibilities that need to be verified
+# This runs in 2^n * n^2 time, instead of the n! time taken to verify
+# every permutation of cities.
 #
 # The general algorithm and approach to problem solving was learnt from
 # Peter Norvig's TSP iPython notebook
 # http://norvig.com/ipython/
 
 
-from itertools import permutations
 import logging
 import re
 import sys
 
+from held_karp import distance_matrix
+from held_karp import held_karp
+
 
 logger = logging.getLogger('__file__')
 logger.setLevel(logging.ERROR)
@@ -116,73 +119,23 @@ for line in text:
 logger.info('Cities: {cities}\n\n'.format(cities=cities))
 
 
-def route_distance(origin, destination):
-    """Calculate the distance of route between two cities.
-    Will return None if route does not exist. """
-
-    # Get route from routes
-    # In any direction, i.e. x->y AND y->x
-    route = [
-        x for x in routes
-        if (x['to'] == destination and x['from'] == origin)
-        or (x['from'] == destination and x['to'] == origin)]
-
-    # If such a route exists, return its distance.
-    # Else, return None
-    if route:
-        return route[0]['distance']
-    else:
-        return None
-
-
-def tour_length(tour):
-    """Calculate the length of tour.
-    Will return sum of all routes from first city to last,
-    or None if the tour contains invalid routes. """
-
-    length = 0  # length of tour
-    for i in range(1, len(tour)):  # iterate over each city pair
-        length_route = route_distance(tour[i], tour[i - 1])
-        # If the route is invalid, return None
-        if length_route is None:
-            return None
-        length += length_route
-
-    return length
-
-
-def shortest_tour(tours):
-    """Get the shortest tours out of all given tours.
-    The shortest tour is chosen based on tour distance,
-    i.e. sum of all distances of cities along the route. """
-
-    # Get tour length for each tour
-    tours = [(tour, tour_length(tour)) for tour in tours]
-    for tour, distance in tours:
-        logger.debug(
-            '{tour} --> {distance}'.format(
-                tour=tour, distance=distance))
-
-    # Remove tours that contain invalid routes,
-    # specified by distance = None
-    tours = [
-        (tour, distance) for tour, distance in tours
-        if distance is not None]
-
-    # Return tour with shortest distance,
-    # accessed at position 1 in the tuple
-    return min(tours, key=lambda x: x[1])
-
-
-def alltours_tsp(cities):
+def held_karp_tsp(cities):
     """Solve the Travelling Salesman Problem for the given set of cities.
     Will return a tuple containing the tour and its total distance. """
 
-    return shortest_tour(permutations(cities))
+    # Number the cities and create the matrix of distances between them
+    cities = sorted(cities)
+    matrix = distance_matrix(routes, cities)
+
+    tour, distance = held_karp(matrix)
+    if tour is None:
+        return None, None
+
+    return tuple(cities[city] for city in tour), distance
 
 
 # get the shortest tour and distance through TSP algorithm
-tour, distance = alltours_tsp(cities)
+tour, distance = held_karp_tsp(cities)
 print(distance)
 
 logger.info(' ### ENDED PROGRAM ###')
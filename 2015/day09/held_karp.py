@@ -0,0 +1,103 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+""" Held-Karp dynamic programming for routes through every city.
+
+https://en.wikipedia.org/wiki/Held%E2%80%93Karp_algorithm
+
+Cities are numbered, and the distances between them kept in a matrix,
+so that a set of visited cities is the bits of an int.
+For every set of cities and every city in it,
+the table holds the best distance of a route that visits exactly
+those cities and ends at that city, starting at any of them.
+A route ending at a city is extended by every city not yet visited,
+so the sets are filled in increasing order, and the best route
+through all cities is the best of the routes ending at each city.
+
+This takes O(2^n * n^2) time, instead of the O(n!) of trying every
+permutation of cities, and O(2^n * n) memory.
+Santa does not return to the starting city, so the routes are paths.
+The longest route is found by running it with the distances negated. """
+
+
+from array import array
+
+
+def distance_matrix(routes, cities):
+    """Create a matrix of distances between cities, by their number
+
+    Distances are the same in both directions,
+    and are None between cities that have no route."""
+
+    number = {city: index for index, city in enumerate(cities)}
+    matrix = [[None] * len(cities) for _ in cities]
+    for route in routes:
+        origin = number[route['from']]
+        destination = number[route['to']]
+        matrix[origin][destination] = route['distance']
+        matrix[destination][origin] = route['distance']
+
+    return matrix
+
+
+def held_karp(matrix, longest=False):
+    """Get the best route through all cities, and its distance
+
+    The route is a list of city numbers.
+    The best route is the shortest, or the longest with longest.
+    Returns (None, None) if there is no route through all cities."""
+
+    n = len(matrix)
+    if n == 0:
+        return None, None
+
+    # Negating distances turns looking for the longest into the shortest
+    sign = -1 if longest else 1
+    weights = [
+        [None if distance is None else sign * distance for distance in row]
+        for row in matrix]
+
+    # Table of best distances, and the city before the last one,
+    # for every set of cities and every last city,
+    # flattened so that (visited, last) is at visited * n + last.
+    # unset is larger than any possible route.
+    unset = sum(
+        abs(distance) for row in matrix for distance in row
+        if distance is not None) + 1
+    best = array('q', [unset]) * ((1 << n) * n)
+    previous = array('l', [-1]) * ((1 << n) * n)
+
+    # A route of a single city has no distance
+    for city in range(n):
+        best[(1 << city) * n + city] = 0
+
+    for visited in range(1, 1 << n):
+        for last in range(n):
+            distance = best[visited * n + last]
+            if distance == unset:
+                continue
+            row = weights[last]
+            for city in range(n):
+                if visited >> city & 1 or row[city] is None:
+                    continue
+                index = (visited | 1 << city) * n + city
+                if distance + row[city] < best[index]:
+                    best[index] = distance + row[city]
+                    previous[index] = last
+
+    # Pick the best route through all cities,
+    # then walk back through the cities before it.
+    everything = (1 << n) - 1
+    last = min(range(n), key=lambda city: best[everything * n + city])
+    distance = best[everything * n + last]
+    if distance == unset:
+        return None, None
+
+    route = []
+    visited = everything
+    while last != -1:
+        route.append(last)
+        last, visited = previous[visited * n + last], visited ^ (1 << last)
+    route.reverse()
+
+    return route, sign * distance
@@ -27,7 +27,7 @@ Starting with the digits in your puzzle input,
 apply this process 40 times. What is the length of the result? """
 
 
-import re
+from look_and_say import sequence_length
 
 
 # get the input number
@@ -35,15 +35,7 @@ with open('./input.txt', 'r') as f:
     number = f.readline().strip()
 
 
-# iterate 40 times, repeating the process
-for i in range(50):
-    # each number is two strings:
-    # length of the input, and the digit of the input
-    number = ''.join([
-        # join the first matched group containing the repeated digits
-        ''.join((str(len(match.group(0))), match.group(0)[0]))
-        # extract the repeated digits as group from the input
-        for match in re.finditer(r'(\d)\1*', number)])
-
-# print the length of the number as answer
-print(len(number))
+# repeat the process 50 times,
+# keeping count of the elements in the number instead of its digits,
+# and print the length of the number as answer
+print(sequence_length(number, 50))
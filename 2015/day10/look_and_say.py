@@ -0,0 +1,176 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" Look-and-say through Conway's atomic elements.
+
+https://en.wikipedia.org/wiki/Look-and-say_sequence#Cosmological_decay
+
+Conway showed that, from the second round onwards, a look-and-say
+sequence can be split into elements which never interact again:
+each element turns into the same sequence of elements every round,
+no matter what is on either side of it. Starting from any of the
+usual seeds, only 92 different elements ever show up.
+
+So instead of building the sequence, only the number of each element
+is kept. Every round, each element adds its count to the elements
+it turns into, which is O(92) work per round however long the
+sequence is, and the length is the count of each element times
+its length. The elements and what they turn into are found from the
+seed itself, by splitting each new sequence into elements.
+
+A sequence splits between a left part L and a right part R
+(Conway's Splitting Theorem) when:
+ - L ends with a digit of 4 or more, and R starts with one of 3 or less
+ - L ends with 2, and R starts with a single 1 followed by
+   a single digit, three 1s, a single 3 followed by anything other
+   than a run of three, or is only a single digit of 4 or more
+ - L does not end with 2, and R starts with 22 followed by
+   one of the above, or by nothing at all
+
+digits yields the digits of the sequence one at a time,
+for when the digits themselves are needed,
+walking down what each element turns into instead of
+building the sequence. """
+
+
+from itertools import groupby
+
+
+def look_and_say(digits):
+    """Read the runs of digits aloud, once"""
+
+    return ''.join(
+        str(len(list(run))) + digit for digit, run in groupby(digits))
+
+
+def _splits(last, runs):
+    """Check if a sequence splits between a digit and the runs after it"""
+
+    digit, count = runs[0]
+
+    # 4 or more, followed by 3 or less
+    if last >= '4':
+        return digit <= '3'
+
+    # After anything but 2, a pair of 22 has to come first
+    if last != '2':
+        if digit != '2' or count != 2:
+            return False
+        runs = runs[1:]
+        if not runs:
+            return True
+        digit, count = runs[0]
+
+    if digit == '1' and count == 1:
+        return len(runs) > 1 and runs[1][1] == 1
+    if digit == '1' and count == 3:
+        return True
+    if digit == '3' and count == 1:
+        return len(runs) > 1 and runs[1][1] != 3
+    return digit >= '4' and count == 1 and len(runs) == 1
+
+
+def split_elements(digits):
+    """Split a sequence, at least two rounds old, into its elements"""
+
+    runs = [(digit, len(list(run))) for digit, run in groupby(digits)]
+    elements = []
+    element = ''
+    for index, (digit, count) in enumerate(runs):
+        if element and _splits(element[-1], runs[index:]):
+            elements.append(element)
+            element = ''
+        element += digit * count
+    if element:
+        elements.append(element)
+
+    return elements
+
+
+class Elements(object):
+
+    """The elements reachable from a seed, and what each turns into
+
+    Elements are numbered, so that the counts of the elements
+    in a sequence are a list indexed by their number."""
+
+    def __init__(self, seed):
+        # The sequence can only be split once it is two rounds old
+        self.start = look_and_say(look_and_say(seed))
+
+        # Find every element by following what each one turns into
+        self.names = []
+        self.number = {}
+        self.decays = []
+        pending = split_elements(self.start)
+        while pending:
+            element = pending.pop()
+            if element in self.number:
+                continue
+            self.number[element] = len(self.names)
+            self.names.append(element)
+            self.decays.append(split_elements(look_and_say(element)))
+            pending.extend(self.decays[-1])
+
+        # What each element turns into, by number
+        self.decays = [
+            [self.number[element] for element in decay]
+            for decay in self.decays]
+        self.lengths = [len(element) for element in self.names]
+
+    def counts(self, rounds):
+        """Get the count of every element after the rounds, from round 2"""
+
+        counts = [0] * len(self.names)
+        for element in split_elements(self.start):
+            counts[self.number[element]] += 1
+
+        for _ in range(rounds - 2):
+            new_counts = [0] * len(counts)
+            for element, count in enumerate(counts):
+                if count:
+                    for decay in self.decays[element]:
+                        new_counts[decay] += count
+            counts = new_counts
+
+        return counts
+
+
+def sequence_length(seed, rounds):
+    """Get the length of the sequence after the rounds"""
+
+    # The first two rounds can not be split into elements
+    if rounds < 2:
+        for _ in range(rounds):
+            seed = look_and_say(seed)
+        return len(seed)
+
+    elements = Elements(seed)
+    return sum(
+        count * length
+        for count, length in zip(elements.counts(rounds), elements.lengths))
+
+
+def digits(seed, rounds):
+    """Yield the digits of the sequence after the rounds, one at a time"""
+
+    if rounds < 2:
+        for _ in range(rounds):
+            seed = look_and_say(seed)
+        yield from seed
+        return
+
+    elements = Elements(seed)
+    start = [elements.number[x] for x in split_elements(elements.start)]
+
+    # Stack of (element, rounds left for it to go through),
+    # the top of the stack is the next element in the sequence
+    stack = [(element, rounds - 2) for element in reversed(start)]
+    while stack:
+        element, rounds_left = stack.pop()
+        if not rounds_left:
+            yield from elements.names[element]
+            continue
+        stack.extend(
+            (decay, rounds_left - 1)
+            for decay in reversed(elements.decays[element]))
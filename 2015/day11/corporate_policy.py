@@ -57,105 +57,15 @@ Given Santa's current password (your puzzle input),
 what should his next password be? """
 
 
-import re
-
-
-def has_bad_letters(password):
-    """Check if password string has any of the bad characters"""
-
-    if 'i' in password:
-        return True
-    if 'o' in password:
-        return True
-    if 'l' in password:
-        return True
-    return False
-
-
-def has_double_pair(password):
-    """Check if password has two pairs of repeating letters"""
-
-    # reconvert the password character array to string
-    password = ''.join([chr(c) for c in password])
-
-    # pattern matches all repeating characters twice
-    pattern = r'(.)\1'
-
-    if len(re.findall(pattern, password)) < 2:
-        return False
-    return True
-
-
-def has_consecutive_letters(password):
-    """Check if password has three consecutive sequenced letters"""
-
-    # Check each set of three letters to see if they differ by 1
-    # in their ascii code
-    for i in range(len(password) - 2):
-        if ((password[i] - password[i + 1] == -1) and
-                (password[i + 1] - password[i + 2] == -1)):
-            return True
-    return False
-
-
-def increment(password):
-    """ Increment the password string.
-    Will increase the right-most character by 1,
-    and if it wraps around back to a,
-    will move to the character on the left. """
-
-    # Iterate over the password string right to left
-    # i goes from 0 to len(p) - 1
-    # Therefore, j = -1 - i will go from len(p) -1 to 0
-    for i in range(len(password)):
-
-        # Increment and wrap character within the range a-z
-        # p[-1 - i] + 1 : increment character by 1
-        # - 97 : substract from 'a' to get relative position
-        # % 26 : keep it within 0 - 25 the character range
-        # + 97 : add 'a' again to make it an ascii letter
-        # This increments the range from 97 to 122 (97 + 26)
-        # and then wraps it back to 97 instead of 123
-        password[-1 - i] = 97 + (password[-1 - i] + 1 - 97) % 26
-
-        # check if character has wrapped by checking if it is 'a'
-        # because 'z' -> 'a'
-        # If character has not wrapped, break the loop
-        if password[-1 - i] != 97:
-            break
-
-    return password
+from passwords import next_passwords
 
 
 def find_password(password):
     """Find the next password given the current password string"""
 
-    # Convert the password into a character array
-    password = [ord(c) for c in password]
-
-    # Continue as long as there's no valid password
-    while True:
-
-        # increment password
-        password = increment(password)
-
-        # check if it has bad letters
-        if has_bad_letters(password):
-            continue
-
-        # check if it has consecutive letters
-        if not has_consecutive_letters(password):
-            continue
-
-        # check if it has double pair of repeating characters
-        if not has_double_pair(password):
-            continue
-
-        # if it satisfies all the conditions, break the loop
-        break
-
-    # return the string form of the password
-    return ''.join([chr(c) for c in password])
+    # Candidates skip every password with a bad letter,
+    # so only the straight and the pairs need checking
+    return next(next_passwords(password))
 
 
 # read password string from input file
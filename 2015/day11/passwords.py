@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" Candidate passwords that never contain the bad letters.
+
+Passwords are kept as lists of letter numbers, a = 0 to z = 25,
+and every check works on the numbers without building strings.
+
+Instead of incrementing one password at a time and throwing away
+those with i, o or l, the letters are counted in an alphabet
+that skips them: the letter after h is j, after k is m,
+and after n is p. A password that already has a bad letter
+jumps straight to the letter after it, followed by all a's,
+which skips every password starting with the same letters at once. """
+
+
+# i, o and l may not be used
+BAD_LETTERS = frozenset(ord(c) - ord('a') for c in 'iol')
+
+# The next letter in the alphabet without the bad letters,
+# with z wrapping around to a
+NEXT_LETTER = [
+    next(
+        c % 26 for c in range(letter + 1, letter + 27)
+        if c % 26 not in BAD_LETTERS)
+    for letter in range(26)]
+
+
+def to_letters(password):
+    """Convert a password string to a list of letter numbers"""
+
+    return [ord(c) - ord('a') for c in password]
+
+
+def to_string(letters):
+    """Convert a list of letter numbers to a password string"""
+
+    return ''.join(chr(letter + ord('a')) for letter in letters)
+
+
+def skip_bad_letters(letters):
+    """Move past the first bad letter, if there is one
+
+    Every password starting with the letters up to the bad letter
+    is skipped, by taking the letter after it and setting the rest to a.
+    Returns True if there was a bad letter."""
+
+    for index, letter in enumerate(letters):
+        if letter in BAD_LETTERS:
+            # Bad letters are never z, so this can not wrap around
+            letters[index] = NEXT_LETTER[letter]
+            letters[index + 1:] = [0] * (len(letters) - index - 1)
+            return True
+
+    return False
+
+
+def increment(letters):
+    """Increment the letters in place, never using a bad letter"""
+
+    # Increment the right-most letter, moving to the letter on the left
+    # as long as it wraps around back to a
+    for index in range(len(letters) - 1, -1, -1):
+        letters[index] = NEXT_LETTER[letters[index]]
+        if letters[index]:
+            break
+
+
+def has_straight(letters):
+    """Check if letters have three consecutive sequenced letters"""
+
+    return any(
+        first + 1 == second and second + 1 == third
+        for first, second, third in zip(letters, letters[1:], letters[2:]))
+
+
+def has_double_pair(letters):
+    """Check if letters have two non-overlapping pairs of letters"""
+
+    pairs = 0
+    index = 0
+    while index < len(letters) - 1:
+        if letters[index] == letters[index + 1]:
+            pairs += 1
+            if pairs == 2:
+                return True
+            # Pairs can not overlap
+            index += 2
+        else:
+            index += 1
+
+    return False
+
+
+def next_passwords(password):
+    """Yield the valid passwords after the password, in order"""
+
+    letters = to_letters(password)
+
+    # The first candidate after a password with a bad letter
+    # is the one that skips past it
+    if not skip_bad_letters(letters):
+        increment(letters)
+
+    while True:
+        if has_straight(letters) and has_double_pair(letters):
+            yield to_string(letters)
+        increment(letters)
@@ -23,43 +23,13 @@ You will not encounter any strings containing numbers.
 What is the sum of all numbers in the document? """
 
 
-def add(value):
-    """add the value of the number in the object value"""
+from json_sum import sum_numbers
 
-    # declare the total number sum as a global variable
-    # saves recreating the variable on the stack everytime
-    global number_sum
 
-    # if the value is an int, add it
-    if type(value) == int:
-        number_sum += value
-        return
-
-    # if the value is a list or a dict,
-    # create a reference to iteration of its values
-    if type(value) == list:
-        numbers = value
-    elif type(value) == dict:
-        numbers = value.values()
-        # ignore if any of the values are 'red'
-        if 'red' in numbers:
-            return
-    else:
-        return
-
-    # for iteration, add the value by calling this function recursively
-    for item in numbers:
-        add(item)
-
-
-# read and convert input to json
-import json
+# read the document in chunks and add the ints in it,
+# without loading the whole document
 with open('./input.txt', 'r') as f:
-    data = json.load(f)
-
-# add the ints in document
-number_sum = 0
-add(list(data.values()))
+    number_sum = sum_numbers(f, ignore='red')
 
 # print answer
 print(number_sum)
@@ -0,0 +1,145 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+""" Streaming sum of the numbers in a JSON document.
+
+The document is read in chunks and split into tokens,
+without building the document in memory.
+Arrays and objects that are still open are kept on a stack,
+each with the sum of the numbers seen in it so far.
+When one closes, its sum is added to the one around it.
+
+An object with a value equal to ignore (like "red") counts for nothing,
+along with everything in it. As the value can come after any number
+of others, the object keeps its sum until its closing brace,
+and only then is it added, or dropped if the value was seen.
+
+Only the open arrays and objects and the current chunk are held,
+so memory does not grow with the size of the document. """
+
+
+import re
+
+# Size of the chunks the document is read in
+CHUNK_SIZE = 64 * 1024
+
+WHITESPACE = re.compile(r'[ \t\r\n]*')
+STRING = re.compile(r'"((?:[^"\\]|\\.)*)"', re.DOTALL)
+# Numbers and literals run up to the next delimiter
+SCALAR = re.compile(r'[^ \t\r\n{}\[\]:,"]+')
+NUMBER = re.compile(r'-?\d+(\.\d+)?([eE][+-]?\d+)?')
+LITERALS = ('true', 'false', 'null')
+
+
+class Frame(object):
+
+    """An open array or object"""
+
+    def __init__(self, is_object):
+        self.is_object = is_object
+        # sum of the numbers in it so far
+        self.total = 0
+        # whether it has a value that makes it count for nothing
+        self.ignored = False
+        # objects alternate between keys and values
+        self.expect_key = is_object
+
+
+def tokens(f, chunk_size=CHUNK_SIZE):
+    """Yield the tokens of the document in f, read in chunks
+
+    Tokens are the characters {}[]:, on their own,
+    strings as ('"', contents) and numbers or literals as (kind, text)."""
+
+    buffer = ''
+    eof = False
+    while not eof:
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+
+        position = 0
+        while True:
+            position = WHITESPACE.match(buffer, position).end()
+            if position == len(buffer):
+                break
+
+            character = buffer[position]
+            if character in '{}[]:,':
+                yield character, character
+                position += 1
+                continue
+
+            if character == '"':
+                match = STRING.match(buffer, position)
+            else:
+                match = SCALAR.match(buffer, position)
+
+            # A token running up to the end of the chunk
+            # may carry on in the next one
+            if not eof and (match is None or match.end() == len(buffer)):
+                break
+            if match is None:
+                raise ValueError(
+                    'unexpected {text!r}'.format(
+                        text=buffer[position:position + 20]))
+            position = match.end()
+
+            if character == '"':
+                yield '"', match.group(1)
+            elif NUMBER.fullmatch(match.group(0)):
+                yield '0', match.group(0)
+            elif match.group(0) in LITERALS:
+                yield 'a', match.group(0)
+            else:
+                raise ValueError(
+                    'unexpected {text!r}'.format(text=match.group(0)))
+
+        # Keep what is left for the next chunk
+        buffer = buffer[position:]
+
+
+def sum_numbers(f, ignore=None, chunk_size=CHUNK_SIZE):
+    """Get the sum of the numbers in the document in f
+
+    Objects with a value equal to ignore are not counted."""
+
+    stack = []
+    total = 0
+
+    for kind, text in tokens(f, chunk_size):
+        frame = stack[-1] if stack else None
+
+        if kind == '{' or kind == '[':
+            stack.append(Frame(kind == '{'))
+
+        elif kind == '}' or kind == ']':
+            stack.pop()
+            if not frame.ignored:
+                if stack:
+                    stack[-1].total += frame.total
+                else:
+                    total += frame.total
+
+        elif kind == ':':
+            frame.expect_key = False
+
+        elif kind == ',':
+            frame.expect_key = frame.is_object
+
+        elif kind == '"':
+            if (frame is not None and frame.is_object
+                    and not frame.expect_key and text == ignore):
+                frame.ignored = True
+
+        elif kind == '0':
+            if text.lstrip('-').isdigit():
+                number = int(text)
+            else:
+                number = float(text)
+            if frame is None:
+                total += number
+            else:
+                frame.total += number
+
+    return total
@@ -135,40 +135,12 @@ for line in text:
     reactions[self][other] = points
 
 
-def score_group(group):
-    """Calculate score of the group based on their reactions"""
-
-    # Set initial score to 0.
-    # This is the net happiness before they sit in the group.
-    #
-    # Calculate the score of the by taking a pair at a time,
-    # and calculating both their reactions for each other.
-    # Note: python wraps around from first to last input
-    # because of the list[-1] notation
-    score = 0
-    for i in range(len(group)):
-        score += reactions[group[i - 1]][group[i]]
-        score += reactions[group[i]][group[i - 1]]
-
-    return score
-
-
-# best score resulting in maximum happiness gain for group
-best_score = 0
-# arrangement resulting in maximum happiness gain
-best_arrangement = None
-
-
-# To get all possible iterations of group arrangements,
-# use permutations.
-# Check the score of each one, and save the best score
-# available so far.
+# Seat the first person at the head of the table,
+# and fill the other seats one at a time,
+# keeping the best happiness for every set of people seated so far
+# and the person in the last seat.
 # At the end, the score would reflect the best arrangement possible.
-from itertools import permutations
-for group in permutations(people):
-    score = score_group(group)
-    if best_score < score:
-        best_score = score
-        best_arrangement = group
+from seating import best_seating
+best_score, best_arrangement = best_seating(sorted(people), reactions)
 
 print(best_score)
@@ -0,0 +1,98 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+""" Optimal seating around a circular table through bitmask DP.
+
+Turning the table around does not change the happiness of anyone,
+so the first person can always sit in the first seat,
+which leaves (n - 1)! arrangements instead of n!.
+Rather than trying each of them, the seats are filled in one at a time:
+for every set of people seated after the first one,
+and every person in the last seat, the table holds the best happiness
+of the seated neighbours. Seating someone new next to the last person
+only adds the happiness between the two of them, so each set of
+people is built from the smaller sets, in O(2^n * n^2) time.
+The table is closed by seating the last person next to the first one.
+
+The happiness between a pair of neighbours is what both of them feel,
+reactions[a][b] + reactions[b][a], which is worked out once
+into a flat matrix where the pair (a, b) is at a * n + b. """
+
+
+from array import array
+
+
+def happiness_matrix(people, reactions):
+    """Create a flat matrix of the happiness of each pair of neighbours"""
+
+    n = len(people)
+    matrix = array('l', [0]) * (n * n)
+    for a, person in enumerate(people):
+        for b, other in enumerate(people):
+            if a != b:
+                matrix[a * n + b] = (
+                    reactions[person][other] + reactions[other][person])
+
+    return matrix
+
+
+def best_seating(people, reactions):
+    """Get the best happiness of a seating arrangement, and the arrangement
+
+    The arrangement is a tuple of people around the table,
+    starting with the first person."""
+
+    people = list(people)
+    n = len(people)
+    if n < 2:
+        return 0, tuple(people)
+
+    pair = happiness_matrix(people, reactions)
+
+    # The people after the first one are numbered 1 to n - 1,
+    # and a set of them is bits 0 to n - 2 of an int.
+    # (seated, last) is at seated * n + last,
+    # unset marks arrangements that have not been reached.
+    sets = 1 << (n - 1)
+    unset = -sum(abs(x) for x in pair) - 1
+    best = array('l', [unset]) * (sets * n)
+    previous = array('l', [-1]) * (sets * n)
+
+    # Seat each person next to the first one
+    for person in range(1, n):
+        best[(1 << (person - 1)) * n + person] = pair[person]
+        previous[(1 << (person - 1)) * n + person] = 0
+
+    for seated in range(1, sets):
+        for last in range(1, n):
+            happiness = best[seated * n + last]
+            if happiness == unset:
+                continue
+            row = last * n
+            for person in range(1, n):
+                bit = 1 << (person - 1)
+                if seated & bit:
+                    continue
+                index = (seated | bit) * n + person
+                if happiness + pair[row + person] > best[index]:
+                    best[index] = happiness + pair[row + person]
+                    previous[index] = last
+
+    # Close the table by seating the last person next to the first one
+    everyone = sets - 1
+    last = max(
+        range(1, n),
+        key=lambda person: best[everyone * n + person] + pair[person * n])
+    happiness = best[everyone * n + last] + pair[last * n]
+
+    # Walk back through the people seated before the last one
+    arrangement = []
+    seated = everyone
+    while last:
+        arrangement.append(people[last])
+        last, seated = (
+            previous[seated * n + last], seated ^ (1 << (last - 1)))
+    arrangement.append(people[0])
+    arrangement.reverse()
+
+    return happiness, tuple(arrangement)
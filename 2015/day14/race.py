@@ -0,0 +1,94 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+""" Second by second race of reindeer, scoring the leaders.
+
+Each reindeer has a speed for every second of the race:
+its flight speed while flying, and 0 while resting.
+The distance of every reindeer at every second is the running sum
+of those speeds, so with numpy the whole matrix of distances
+(seconds x reindeer) comes from one cumulative sum,
+and the leaders of every second are the reindeer
+equal to the maximum of their row. Everyone tied for the lead
+gets a point, so this compares with the row maximum instead of
+taking a single argmax.
+
+The race is run in chunks of seconds, carrying the distances
+at the end of each chunk over to the next one,
+so the memory used depends on the chunk, not on the length of the race.
+
+Without numpy, the distances are kept up to date second by second,
+adding each speed instead of working out every distance from scratch. """
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Cells of the (seconds x reindeer) matrix worked out at a time
+CHUNK_CELLS = 1 << 20
+
+
+def race(reindeers, duration, use_numpy=True):
+    """Race the reindeers for the duration, in seconds
+
+    reindeers is a list of (flight_speed, flight_duration, rest).
+    Returns the distances traveled, and the points of each reindeer."""
+
+    if not reindeers:
+        return [], []
+
+    if use_numpy and numpy is not None:
+        return _race_numpy(reindeers, duration)
+
+    speeds = [speed for speed, _, _ in reindeers]
+    flights = [flight for _, flight, _ in reindeers]
+    cycles = [flight + rest for _, flight, rest in reindeers]
+    distances = [0] * len(reindeers)
+    points = [0] * len(reindeers)
+    everyone = range(len(reindeers))
+
+    for second in range(duration):
+        # move the reindeer that are flying during this second
+        for i in everyone:
+            if second % cycles[i] < flights[i]:
+                distances[i] += speeds[i]
+
+        # every reindeer in the lead gets a point
+        lead = max(distances)
+        for i in everyone:
+            if distances[i] == lead:
+                points[i] += 1
+
+    return distances, points
+
+
+def _race_numpy(reindeers, duration):
+    """Race the reindeers with numpy, a chunk of seconds at a time"""
+
+    stats = numpy.array(reindeers, dtype=numpy.int64)
+    speeds = stats[:, 0]
+    flights = stats[:, 1]
+    cycles = stats[:, 1] + stats[:, 2]
+
+    distances = numpy.zeros(len(reindeers), dtype=numpy.int64)
+    points = numpy.zeros(len(reindeers), dtype=numpy.int64)
+    chunk = max(1, CHUNK_CELLS // len(reindeers))
+
+    for start in range(0, duration, chunk):
+        # seconds in this chunk as a column,
+        # so that they pair up with every reindeer
+        seconds = numpy.arange(
+            start, min(start + chunk, duration), dtype=numpy.int64)[:, None]
+
+        # distance of every reindeer at every second of the chunk
+        flying = (seconds % cycles) < flights
+        chunk_distances = numpy.cumsum(flying * speeds, axis=0) + distances
+        distances = chunk_distances[-1]
+
+        # every reindeer equal to the row maximum is in the lead
+        lead = chunk_distances.max(axis=1, keepdims=True)
+        points += (chunk_distances == lead).sum(axis=0)
+
+    return distances.tolist(), points.tolist()
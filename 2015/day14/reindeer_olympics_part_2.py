@@ -67,18 +67,14 @@ how many points does the winning reindeer have? """
 
 
 # LOGIC
-# calculate the distance the reindeer travels by calculating chunks of
-# the reindeer when it is (flying, then resting)
-# after that, whatever time is left, use it to fly the reindeer
-# for max(flight_duration).
-# So for eg. time left after 10 rounds of flying and resting was 20secs,
-# and the reindeer rests after 10 secs,
-# all the duration for flight of another 10secs to the duration.
+# every second, a reindeer moves by its flight speed while flying,
+# and by 0 while resting, so its distance at every second is the
+# running sum of its speed for each second.
 #
-# Use this method to calculate the distance the reindeer has traveled every
-# second until the last second.
-# After every iteration, check who is in the lead,
-# and increase their points by 1.
+# Working out the running sums of all the reindeer together
+# gives the distance of every reindeer at every second.
+# Every second, whoever is at the maximum distance is in the lead,
+# and increases their points by 1.
 # Then count all their points to get the winner.
 
 
@@ -111,47 +107,16 @@ for line in text:
     }
 
 
-def calculate_reindeer_run(reindeer, duration):
-    """Calculate distance travelled by reindeer in specified duration"""
-
-    # get reindeer stats
-    flight_speed = reindeer['flight_speed']
-    flight_duration = reindeer['flight_duration']
-    rest_period = reindeer['rest']
-
-    # get number of rounds reinder flies and rests
-    rounds = duration // (flight_duration + rest_period)
-    # time spent during rounds
-    time_spent = rounds * (flight_duration + rest_period)
-    # distance covered during rounds
-    distance_covered = rounds * flight_speed * flight_duration
-    # time left after rounds
-    time_left = duration - time_spent
-
-    # whatever time is left,
-    # fly for a bit (until flight duration or time left runs out)
-    # and add that to the total duration
-    if flight_duration <= time_left:
-        distance_covered += flight_speed * flight_duration
-    else:
-        distance_covered += flight_speed * time_left
-
-    # save the distance the reindeer has traveled
-    # useful for looking at who is in the lead
-    reindeer['distance_traveled'] = distance_covered
-    return distance_covered
-
-
-# run iterations from second 1 to problem duration
-# check what is the maximum distance from all reindeers
-# then get all the leaders with the same max distance
-# increase their points by 1
-for i in range(1, problem_duration + 1):
-    max_dist = max([calculate_reindeer_run(r, i) for r in reindeers.values()])
-    for r in [
-            r for r in reindeers.values()
-            if r['distance_traveled'] == max_dist]:
-        r['points'] += 1
+# race the reindeers second by second, scoring the leaders every second
+from race import race
+distances, points = race(
+    [
+        (r['flight_speed'], r['flight_duration'], r['rest'])
+        for r in reindeers.values()],
+    problem_duration)
+for r, r_distance, r_points in zip(reindeers.values(), distances, points):
+    r['distance_traveled'] = r_distance
+    r['points'] = r_points
 
 # get the maximum points amongst all reindeers at the end
 print(max([r['points'] for r in reindeers.values()]))
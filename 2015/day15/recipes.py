@@ -0,0 +1,164 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" Best cookie recipes for any number of ingredients.
+
+A recipe is a composition of the teaspoons: an amount of every
+ingredient, adding up to the teaspoons. The compositions are built
+one ingredient at a time, keeping the totals of each property so far,
+so nothing is worked out again for every recipe.
+
+Whole branches of recipes are skipped as soon as they can not score:
+ - with the teaspoons left, the ingredients still to come can only
+   add between their lowest and highest calories per teaspoon,
+   so a branch that can not reach the calories is dropped
+ - in the same way, a property that can not end up above 0
+   makes every recipe in the branch score 0
+
+The last two ingredients share whatever teaspoons are left,
+which is the innermost and by far the largest loop.
+With numpy, each of those splits is scored all at once,
+as the product of the amounts with the ingredient matrix.
+Recipes that score 0 are never returned. """
+
+
+import heapq
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TEASPOONS = 100
+
+
+def ingredient_matrix(ingredients):
+    """Split ingredients into a matrix of their properties and calories
+
+    Each ingredient is a sequence of properties, ending with calories.
+    The matrix has a row of properties for each ingredient."""
+
+    matrix = [list(ingredient[:-1]) for ingredient in ingredients]
+    calories = [ingredient[-1] for ingredient in ingredients]
+    return matrix, calories
+
+
+def _prefixes(matrix, calories, teaspoons, target):
+    """Yield the amounts of all but the last two ingredients
+
+    Yields (amounts, totals, calories so far, teaspoons left),
+    skipping the branches that can not score."""
+
+    n = len(matrix)
+    properties = range(len(matrix[0]))
+
+    # Highest value of each property, and lowest and highest calories,
+    # from each ingredient to the last one
+    highest = [
+        [max(row[p] for row in matrix[i:]) for p in properties]
+        for i in range(n)]
+    fewest = [min(calories[i:]) for i in range(n)]
+    most = [max(calories[i:]) for i in range(n)]
+
+    amounts = [0] * (n - 2)
+
+    def compose(i, totals, eaten, left):
+        if target is not None and not (
+                eaten + left * fewest[i] <= target <= eaten + left * most[i]):
+            return
+        if any(totals[p] + left * highest[i][p] <= 0 for p in properties):
+            return
+
+        if i == n - 2:
+            yield amounts, totals, eaten, left
+            return
+
+        row = matrix[i]
+        for amount in range(left + 1):
+            amounts[i] = amount
+            yield from compose(
+                i + 1,
+                [total + amount * value for total, value in zip(totals, row)],
+                eaten + amount * calories[i],
+                left - amount)
+
+    return compose(0, [0] * len(properties), 0, teaspoons)
+
+
+def _scored(matrix, calories, teaspoons, target):
+    """Yield (score, amounts) of the recipes that score"""
+
+    first, second = matrix[-2], matrix[-1]
+    for amounts, totals, eaten, left in _prefixes(
+            matrix, calories, teaspoons, target):
+        for amount in range(left + 1):
+            rest = left - amount
+            if target is not None and (
+                    eaten + amount * calories[-2] + rest * calories[-1]
+                    != target):
+                continue
+
+            score = 1
+            for total, a, b in zip(totals, first, second):
+                total += amount * a + rest * b
+                if total <= 0:
+                    break
+                score *= total
+            else:
+                yield score, tuple(amounts) + (amount, rest)
+
+
+def _scored_numpy(matrix, calories, teaspoons, target):
+    """Yield (score, amounts) of the recipes that score, with numpy"""
+
+    last_two = numpy.array(matrix[-2:], dtype=numpy.int64)
+    last_calories = numpy.array(calories[-2:], dtype=numpy.int64)
+    for amounts, totals, eaten, left in _prefixes(
+            matrix, calories, teaspoons, target):
+        # Every way of splitting the teaspoons left between the two
+        splits = numpy.arange(left + 1, dtype=numpy.int64)
+        splits = numpy.column_stack((splits, left - splits))
+
+        if target is not None:
+            splits = splits[splits.dot(last_calories) + eaten == target]
+
+        properties = splits.dot(last_two) + numpy.array(totals)
+        scoring = (properties > 0).all(axis=1)
+        scores = properties[scoring].prod(axis=1)
+        for score, (amount, rest) in zip(
+                scores.tolist(), splits[scoring].tolist()):
+            yield score, tuple(amounts) + (amount, rest)
+
+
+def best_recipes(
+        ingredients, count=1, teaspoons=TEASPOONS, calories=None,
+        use_numpy=True):
+    """Get the highest-scoring recipes, best first
+
+    Returns a list of up to count (score, amounts),
+    where amounts are the teaspoons of each ingredient in order.
+    If calories is given, only recipes with exactly
+    that many calories are considered."""
+
+    if not ingredients:
+        return []
+
+    matrix, ingredient_calories = ingredient_matrix(ingredients)
+
+    # Only one ingredient leaves nothing to choose
+    if len(ingredients) == 1:
+        if calories is not None and (
+                teaspoons * ingredient_calories[0] != calories):
+            return []
+        score = 1
+        for value in matrix[0]:
+            score *= max(teaspoons * value, 0)
+        return [(score, (teaspoons,))] if score else []
+
+    if use_numpy and numpy is not None:
+        scored = _scored_numpy(
+            matrix, ingredient_calories, teaspoons, calories)
+    else:
+        scored = _scored(matrix, ingredient_calories, teaspoons, calories)
+
+    return heapq.nlargest(count, scored)
@@ -48,9 +48,6 @@ Given the ingredients in your kitchen and their properties,
 what is the total score of the highest-scoring cookie you can make? """
 
 
-from operator import mul
-from functools import reduce
-
 # create ingredient tuple
 from collections import namedtuple
 Ingredient = namedtuple(
@@ -67,49 +64,11 @@ with open('./input.txt', 'r') as f:
     for line in f.readlines():
         ingredients.append(Ingredient(*map(int, pattern.findall(line))))
 
-# recipes (batches of ingredients)
-recipes = []
-
-
-def score(variations, ingredients):
-    """Calculate score for given recipe.
-    Variations provide numbers for each ingredient,
-    ingredients supply the ingredient attributes. """
-
-    # total score for this recipe
-    total = []
-
-    # combine same attrib from different ingredients
-    # e.g. all capacity in one tuple, all durability in another
-    attrib_scores = zip(*ingredients)
-
-    # zip(attrib, variations) will create a two-item tuple for
-    # each attribute of ingredient over the selected variation
-    # e.g. (capacity, i), (durability, i), etc... for i,j,k,l
-    # then multiply two items to get the score for that attribute
-    for attrib in attrib_scores:
-        total.append([x[0] * x[1] for x in zip(attrib, variations)])
-
-    # summation of same attribute over different ingredients
-    next = list(map(sum, total))
-
-    # calories value, currently not required, hence removed
-    # calories = next[-1]
-    next = next[:-1]
-
-    # if any of the values of attributes are negative, set them to 0
-    next = list(map(lambda x: max(x, 0), next))
-
-    # calculate total score by multiplying different attributes
-    return reduce(mul, next)
-
-
-# reach 100 permutations of each ingredient quantity
-for i in range(0, 101):
-    for j in range(0, 101 - i):
-        for k in range(0, 101 - i - j):
-            l = 100 - k - j - i
-            recipes.append(score([i, j, k, l], ingredients))
+# find the best recipe, skipping those that can not score
+from recipes import best_recipes
+best = best_recipes(ingredients)
+# no recipe scoring means the best score is 0
+best_score = best[0][0] if best else 0
 
 # print the maximum scored recipe
-print(max(recipes))
+print(best_score)
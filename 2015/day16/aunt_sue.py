@@ -53,36 +53,18 @@ you simply don't remember the value.
 What is the number of the Sue that got you the gift? """
 
 
-# output of the MSCSAM
-mfcsam = {}
-
-# input patterns
-import re
-pattern_mfcsam = re.compile(r'(\w+): (\d)+')
-pattern_inputs = re.compile(
-    r'Sue (\d+): (\w+): (\d+), (\w+): (\d+), (\w+): (\d+)')
-
-# open and read input
+# read the MFCSAM output, and what each Aunt Sue remembers
+from aunts import AuntIndex, read_input
 with open('./input.txt', 'r') as f:
-
-    # first 10 lines contain MFCSAM output
-    for i in range(10):
-        line = f.readline()
-        attrib, val = pattern_mfcsam.match(line).groups()
-        mfcsam[attrib] = int(val)
-
-    # read and parse Aunt Sue characteristics
-    # If they are equal to the one by MFCSAM, break the loop
-    for line in f.readlines():
-        aunt_no, attrib1, val1, attrib2, val2, attrib3, val3 = \
-            pattern_inputs.match(line).groups()
-        if mfcsam[attrib1] != int(val1):
-            continue
-        if mfcsam[attrib2] != int(val2):
-            continue
-        if mfcsam[attrib3] != int(val3):
-            continue
-        break
+    mfcsam, sues = read_input(f)
+
+# find the Sue agreeing with every reading
+matches = AuntIndex(sues).match(mfcsam)
+if len(matches) != 1:
+    raise SystemExit(
+        'expected one Aunt Sue to match, found {count}: {matches}'.format(
+            count=len(matches), matches=matches))
+aunt_no = matches[0]
 
 # Print the Aunt no
 print(aunt_no)
@@ -70,44 +70,20 @@ there are fewer than that many
 What is the number of the real Aunt Sue?"""
 
 
-# output of the MSCSAM
-mfcsam = {}
-
-# input patterns
-import re
-pattern_mfcsam = re.compile(r'(\w+): (\d)+')
-pattern_inputs = re.compile(
-    r'Sue (\d+): (\w+): (\d+), (\w+): (\d+), (\w+): (\d+)')
-
-# open and read input
+# read the MFCSAM output, and what each Aunt Sue remembers
+from aunts import AuntIndex, read_input, RETROENCABULATOR
 with open('./input.txt', 'r') as f:
-
-    # first 10 lines contain MFCSAM output
-    for i in range(10):
-        line = f.readline()
-        attrib, val = pattern_mfcsam.match(line).groups()
-        mfcsam[attrib] = int(val)
-
-    # read and parse Aunt Sue characteristics
-    # If they are equal to the one by MFCSAM, break the loop
-    # For cats and trees, the input should be greater
-    # For pomeranians and goldfish, it should be lesser
-    for line in f.readlines():
-        attribs = list(pattern_inputs.match(line).groups())
-        aunt_no = attribs[0]
-        attribs = attribs[1:]
-        for i in range(0, len(attribs), 2):
-            if attribs[i] == 'cats' or attribs[i] == 'trees':
-                if mfcsam[attribs[i]] >= int(attribs[i + 1]):
-                    break
-            elif attribs[i] == 'pomeranians' or attribs[i] == 'goldfish':
-                if mfcsam[attribs[i]] <= int(attribs[i + 1]):
-                    break
-            else:
-                if mfcsam[attribs[i]] != int(attribs[i + 1]):
-                    break
-        else:
-            break
+    mfcsam, sues = read_input(f)
+
+# find the Sue agreeing with every reading
+# For cats and trees, the Sue should have more
+# For pomeranians and goldfish, she should have fewer
+matches = AuntIndex(sues).match(mfcsam, RETROENCABULATOR)
+if len(matches) != 1:
+    raise SystemExit(
+        'expected one Aunt Sue to match, found {count}: {matches}'.format(
+            count=len(matches), matches=matches))
+aunt_no = matches[0]
 
 # Print the Aunt no
 print(aunt_no)
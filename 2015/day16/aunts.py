@@ -0,0 +1,159 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" Indexed lookups of the Aunts Sue matching MFCSAM readings.
+
+Every Aunt Sue only remembers a few of her things,
+and the things she does not remember can be anything,
+so a Sue only stops matching when one of the things she remembers
+disagrees with the readings.
+
+Instead of checking every Sue for every reading, the Sues are grouped
+by the things they remember, and indexed once, for every thing
+of the group, by how many of it they remember having. The values of
+each thing are also kept in order, so the values that agree with
+a reading are a slice of them, whether they have to be exactly equal,
+greater or fewer, and the Sues agreeing with it are the Sues
+with one of those values.
+
+As every Sue of a group remembers the same things, a Sue matches
+when the count of the readings she agrees with is the count of
+the things read that her group remembers: she is in the Sues agreeing
+with every one of them. So the Sues of a group that match are those
+agreeing sets intersected, smallest first, starting with the exact
+readings, which are only a single value each. A group remembering
+none of the things read can not disagree, so all of its Sues match.
+Only the Sues agreeing with the readings are ever looked at,
+never every Sue for every reading. """
+
+
+import re
+from bisect import bisect_left, bisect_right, insort
+
+# How a reading compares to what a Sue remembers
+EXACT = 'exact'
+GREATER = 'greater'
+FEWER = 'fewer'
+
+# The outdated retroencabulator of part 2
+RETROENCABULATOR = {
+    'cats': GREATER,
+    'trees': GREATER,
+    'pomeranians': FEWER,
+    'goldfish': FEWER,
+}
+
+SUE = re.compile(r'Sue (\d+): (.*)')
+THING = re.compile(r'(\w+): (\d+)')
+
+
+def read_input(f):
+    """Read the MFCSAM readings, and the Sues with what they remember
+
+    Returns (readings, sues), where readings is a dict of
+    thing: value, and sues is a list of (number, things)."""
+
+    readings = {}
+    sues = []
+    for line in f:
+        match = SUE.match(line)
+        if match:
+            things = {
+                thing: int(value)
+                for thing, value in THING.findall(match.group(2))}
+            sues.append((int(match.group(1)), things))
+        elif line.strip():
+            thing, value = THING.match(line).groups()
+            readings[thing] = int(value)
+
+    return readings, sues
+
+
+class Group(object):
+
+    """Sues remembering the same things, indexed by their values"""
+
+    def __init__(self):
+        self.sues = set()
+        # thing -> value -> set of Sues remembering that value
+        self.index = {}
+        # thing -> values remembered, in order
+        self.values = {}
+
+    def add(self, number, things):
+        """Add a Sue, with a dict of the things she remembers"""
+
+        self.sues.add(number)
+        for thing, value in things.items():
+            by_value = self.index.setdefault(thing, {})
+            if value not in by_value:
+                by_value[value] = set()
+                insort(self.values.setdefault(thing, []), value)
+            by_value[value].add(number)
+
+    def agreeing(self, thing, reading, rule):
+        """Get the Sues whose value of a thing agrees with its reading"""
+
+        by_value = self.index[thing]
+        if rule == EXACT:
+            return by_value.get(reading, set())
+
+        values = self.values[thing]
+        if rule == GREATER:
+            # The Sue has to remember more than the reading
+            values = values[bisect_right(values, reading):]
+        else:
+            # The Sue has to remember fewer than the reading
+            values = values[:bisect_left(values, reading)]
+        return set().union(*(by_value[value] for value in values))
+
+
+class AuntIndex(object):
+
+    """Aunts Sue, indexed by what they remember"""
+
+    def __init__(self, sues=()):
+        # things remembered -> Group of the Sues remembering just those
+        self.groups = {}
+        for number, things in sues:
+            self.add(number, things)
+
+    def add(self, number, things):
+        """Add a Sue, with a dict of the things she remembers"""
+
+        group = self.groups.get(frozenset(things))
+        if group is None:
+            group = self.groups[frozenset(things)] = Group()
+        group.add(number, things)
+
+    def match(self, readings, rules=None):
+        """Get the numbers of the Sues agreeing with the readings, in order
+
+        rules maps things to GREATER or FEWER,
+        any other thing has to be EXACT."""
+
+        rules = rules or {}
+        sues = []
+        for remembered, group in self.groups.items():
+            # Exact readings first, they agree with the fewest Sues
+            read = sorted(
+                (rules.get(thing, EXACT) != EXACT, thing)
+                for thing in remembered if thing in readings)
+
+            matching = group.sues
+            for _, thing in read:
+                agreeing = group.agreeing(
+                    thing, readings[thing], rules.get(thing, EXACT))
+                matching = (
+                    agreeing & matching if len(agreeing) < len(matching)
+                    else matching & agreeing)
+                if not matching:
+                    break
+            sues.extend(matching)
+
+        return sorted(sues)
+
+    def match_all(self, batch, rules=None):
+        """Get the Sues agreeing with each of a batch of readings"""
+
+        return [self.match(readings, rules) for readings in batch]
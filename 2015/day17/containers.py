@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" Counting the ways of filling containers, by volume and container count.
+
+Rather than trying every combination of containers,
+the containers are added one at a time to a table of
+ways[volume][count]: the number of combinations of the containers so far
+that hold exactly volume, using count containers.
+A new container of size c can be added to any combination
+holding volume - c with count - 1 containers, so
+
+    ways[volume][count] += ways[volume - c][count - 1]
+
+going from the largest volume down, so that every container
+is only used once. With n containers and a volume V, the whole table
+takes O(n * V * n) time, instead of trying all 2^n combinations.
+
+Both the total number of ways of holding a volume,
+and the number of ways with the fewest containers,
+are read from the same row of the table. """
+
+
+def arrangements(containers, volume):
+    """Count the ways of holding each volume up to volume
+
+    Returns a table where table[v][k] is the number of
+    combinations of k containers holding exactly v."""
+
+    containers = list(containers)
+    ways = [[0] * (len(containers) + 1) for _ in range(volume + 1)]
+    ways[0][0] = 1
+
+    # Only counts up to the containers used so far can be reached
+    for used, size in enumerate(containers):
+        # Going down, so that ways[v - size] does not include this container
+        for v in range(volume, size - 1, -1):
+            row, smaller = ways[v], ways[v - size]
+            for count in range(used + 1, 0, -1):
+                if smaller[count - 1]:
+                    row[count] += smaller[count - 1]
+
+    return ways
+
+
+def count_arrangements(containers, volume):
+    """Count the combinations of containers holding exactly volume"""
+
+    return sum(arrangements(containers, volume)[volume])
+
+
+def fewest_containers(containers, volume):
+    """Get the fewest containers holding exactly volume, and their ways
+
+    Returns (count, ways), or (None, 0) if volume can not be held."""
+
+    for count, ways in enumerate(arrangements(containers, volume)[volume]):
+        if ways:
+            return count, ways
+
+    return None, 0
@@ -28,17 +28,10 @@ with open('./input.txt', 'r') as f:
     containers = [int(line) for line in f.readlines()]
 
 
-# iterate over all possibilities  of different combinations
-# and if any of their sum is the volume of eggnog,
-# increase the number of possibilties
-
-possibilities = 0
-
-from itertools import combinations
-for i in range(2, len(containers)):
-    possibilities += len([
-        arrangement
-        for arrangement in combinations(containers, i)
-        if sum(arrangement) == eggnog])
+# count the combinations of containers holding every volume,
+# by the number of containers they use,
+# and add up those holding the eggnog
+from containers import count_arrangements
+possibilities = count_arrangements(containers, eggnog)
 
 print(possibilities)
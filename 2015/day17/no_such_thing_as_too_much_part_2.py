@@ -45,33 +45,10 @@ with open('./input.txt', 'r') as f:
     containers = [int(line) for line in f.readlines()]
 
 
-# iterate over all possibilities  of different combinations
-# and if any of their sum is the volume of eggnog,
-# increase the number of possibilties
-# if there are any such possibilities, save their minimum value
-# this will be used later to calculate the minimum out of all minimums
-
-possibilities = []
-
-from itertools import combinations
-for i in range(2, len(containers)):
-    arrangements = [
-        len(arrangement)
-        for arrangement in combinations(containers, i)
-        if sum(arrangement) == eggnog]
-    if arrangements:
-        possibilities.append(min(arrangements))
-
-
-# calculate the minimum
-# then get all combinations that satiffy the sum and length condition
-# calculate their sum
-minimum = min(possibilities)
-possibilities = 0
-for i in range(2, len(containers)):
-    possibilities += len([
-        arrangement
-        for arrangement in combinations(containers, i)
-        if sum(arrangement) == eggnog and len(arrangement) == minimum])
+# count the combinations of containers holding every volume,
+# by the number of containers they use,
+# then get the ways of holding the eggnog with the fewest containers
+from containers import fewest_containers
+minimum, possibilities = fewest_containers(containers, eggnog)
 
 print(possibilities)
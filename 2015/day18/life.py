@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" Game of Life for grids of lights of any size.
+
+A light is on in the next step if 3 of its neighbours are on,
+or if it is on and 2 of its neighbours are on.
+Lights that are stuck on stay on, whatever their neighbours.
+
+With numpy, the grid is kept in an array with a border of lights
+that are always off, so that the neighbours of every light are
+the eight shifted copies of the grid, added up all at once.
+
+Without numpy, the whole grid is a single int, a bitboard,
+with bit y * (width + 1) + x for the light at (x, y).
+The extra bit at the end of every row is always off, so shifting by
+one moves every light sideways without wrapping around into the next row,
+and shifting by width + 1 moves every light up or down a row.
+The eight shifted boards are added up bit by bit,
+like adding numbers by hand, which counts the neighbours of every light
+at once with a few dozen operations on the int per step. """
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def popcount(bits):
+    """Count the set bits in bits"""
+
+    return bin(bits).count('1')
+
+
+# int.bit_count is only available from python 3.10
+if hasattr(int, 'bit_count'):
+    popcount = int.bit_count
+
+
+def corners(width, height):
+    """Get the lights in the four corners of the grid"""
+
+    return {(0, 0), (width - 1, 0), (0, height - 1), (width - 1, height - 1)}
+
+
+class Life(object):
+
+    """A grid of lights, animated a step at a time"""
+
+    def __init__(self, rows, stuck=(), use_numpy=True):
+        """Create the grid from rows of '#' (on) and '.' (off)
+
+        stuck is a collection of (x, y) lights that are always on."""
+
+        rows = [row.strip() for row in rows]
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else 0
+        self.use_numpy = use_numpy and numpy is not None
+
+        on = {
+            (x, y)
+            for y, row in enumerate(rows)
+            for x, char in enumerate(row)
+            if char == '#'}
+
+        if self.use_numpy:
+            # Grid with a border of lights that are always off
+            self.grid = numpy.zeros(
+                (self.height + 2, self.width + 2), dtype=numpy.uint8)
+            self.stuck = numpy.zeros_like(self.grid, dtype=bool)
+            for x, y in on:
+                self.grid[y + 1, x + 1] = 1
+            for x, y in stuck:
+                self.stuck[y + 1, x + 1] = True
+            self.grid[self.stuck] = 1
+        else:
+            self.stride = self.width + 1
+            # Every light of the grid, without the extra bit of each row
+            row = (1 << self.width) - 1
+            self.cells = sum(
+                row << (y * self.stride) for y in range(self.height))
+            self.board = self._bits(on)
+            self.stuck = self._bits(stuck)
+            self.board |= self.stuck
+
+    def _bits(self, lights):
+        """Get a bitboard of the (x, y) lights"""
+
+        bits = 0
+        for x, y in lights:
+            bits |= 1 << (y * self.stride + x)
+        return bits
+
+    def _step_numpy(self):
+        grid = self.grid
+        inner = grid[1:-1, 1:-1]
+        h, w = inner.shape
+
+        # Add up the eight neighbours of every light
+        neighbours = numpy.zeros_like(inner)
+        for dy in (0, 1, 2):
+            for dx in (0, 1, 2):
+                if dy != 1 or dx != 1:
+                    neighbours += grid[dy:dy + h, dx:dx + w]
+
+        inner[:] = (neighbours == 3) | ((inner == 1) & (neighbours == 2))
+        grid[self.stuck] = 1
+
+    def _step_bits(self):
+        board, cells, stride = self.board, self.cells, self.stride
+
+        # Count the neighbours in three bits: ones, twos,
+        # and whether there are four or more
+        ones = twos = many = 0
+        for shift in (1, stride - 1, stride, stride + 1):
+            for shifted in (board << shift, board >> shift):
+                carry = ones & shifted
+                ones ^= shifted
+                many |= twos & carry
+                twos ^= carry
+
+        # 2 or 3 neighbours, and either 3 or already on
+        self.board = (twos & ~many & (ones | board) & cells) | self.stuck
+
+    def step(self, steps=1):
+        """Animate the lights for a number of steps"""
+
+        for _ in range(steps):
+            if self.use_numpy:
+                self._step_numpy()
+            else:
+                self._step_bits()
+
+    def count(self):
+        """Count the lights that are on"""
+
+        if self.use_numpy:
+            return int(self.grid.sum())
+        return popcount(self.board)
+
+    def rows(self):
+        """Get the rows of the grid, as '#' (on) and '.' (off)"""
+
+        if self.use_numpy:
+            return [
+                ''.join('#' if light else '.' for light in row)
+                for row in self.grid[1:-1, 1:-1]]
+        return [
+            ''.join(
+                '#' if self.board >> (y * self.stride + x) & 1 else '.'
+                for x in range(self.width))
+            for y in range(self.height)]
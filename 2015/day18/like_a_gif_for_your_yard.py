@@ -94,46 +94,18 @@ given your initial configuration,
 how many lights are on after 100 steps? """
 
 
-# read and create lights as a set
-# where only those co-ordinates are stored
-# that correspond to lights that are ON
+# read the grid of lights, where '#' is ON
 with open('./input.txt', 'r') as f:
-    lights = {
-        (x, y)  # co-ordinate
-        # enumerate file, line by line
-        for y, line in enumerate(f)
-        # enumerate line, character by character
-        for x, char in enumerate(line.strip())
-        # only if it is on, as '#' in file
-        if char == '#'}
-
-
-def neighbours(x, y):
-    """Calculate no of neighbours that are ON"""
-
-    # retrurn sum of ON neighbours in vicinity
-    # identified by x+1 -> x-1; y+1 -> y-1
-    # except where the light itself, identified by (x, y)
-    return sum([
-        (i, j) in lights  # check if light is ON
-        for i in (x - 1, x, x + 1)  # positions around
-        for j in (y - 1, y, y + 1)  # positions around
-        if (i, j) != (x, y)])  # skip the light itself
+    rows = [line.strip() for line in f if line.strip()]
 
+from life import Life
+lights = Life(rows)
 
 # iterate the process 100 times
-for i in range(0, 100):
-    # calculate lights set
-    lights = {
-        (x, y)  # co-ordinate for ON light
-        for x in range(0, 100)  # row 100
-        for y in range(0, 100)  # col 100
-        # keep light ON if it has ON neighbours between 2 and 3
-        if (x, y) in lights and 2 <= neighbours(x, y) <= 3
-        # switch light ON if it has ON neighbours exactly 3
-        or (x, y) not in lights and neighbours(x, y) == 3
-    }
+# a light stays ON if it has 2 or 3 ON neighbours
+# and switches ON if it has exactly 3
+lights.step(100)
 
 
 # print number of ON lights
-print(len(lights))
+print(lights.count())
@@ -85,65 +85,15 @@ what is the fewest number of steps to go from e to the medicine molecule? """
 
 
 # LOGIC
-# Greedy approach
-# Substitute the largest substitution first,
-# then continue with largest substitutions in order,
-# until we reach a string
-
-# FOR SOME REASON, THE OUTPUT FLUCTUTATES
-# BETWEEN TWO VALUES THAT SEEM TO NO STABILIZE
+# Going backwards from the medicine to e,
+# undo the replacements one at a time, element by element,
+# preferring the longest replacements first.
+# If that ends up anywhere but e, start over,
+# trying the replacements in a random order.
 
 # read input
+from molecules import Reducer, read_input
 with open('./input.txt', 'r') as f:
-    text = f.readlines()
-
-
-# parsed substitution as tuples of form:
-# (target_string, substitution)
-substitutions = {}
-
-# parse input to get substitutions
-# stop at empty line
-import re
-pattern = re.compile(r'(\w+) => (\w+)')
-for line in text:
-    if len(line.strip()) == 0:
-        break
-    target, sub = pattern.match(line).groups()
-    substitutions[sub] = target
-
-# add string to be changed
-target_string = text[-1]
-target_string = target_string.strip()
-
-# sort the substitutions by size
-# this is useful to replace the biggest strings first
-substitutions_by_size = sorted(substitutions.keys(), key=len, reverse=True)
-
-
-def replace(string):
-
-    if string == 'e':
-        # nothing more to replace
-        return 1
-
-    # get all applicable substitutions,
-    # and then get only the first one using next
-    # this is the applicable substitution because it's the largest
-    try:
-        substitution = next(s for s in substitutions_by_size if s in string)
-    except StopIteration:
-        return 1
-
-    # replace the substitution by its molecule
-    # and replace only the first occurence
-    # pass this string to the replace function
-    # get the number of iterations
-    iterations = replace(
-        string.replace(
-            substitution, substitutions[substitution], 1))
-
-    # return this + other iterations
-    return 1 + iterations
-
-print(replace(target_string))
+    replacements, medicine = read_input(f)
+
+print(Reducer(replacements).reduce(medicine))
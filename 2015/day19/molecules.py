@@ -0,0 +1,180 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" Reducing a molecule back to e, element by element.
+
+The molecule is split into its elements once (Ca, e, H, Rn, ...),
+and every element is numbered, so that replacements work on lists
+of numbers instead of copying and searching strings.
+
+Going backwards, a replacement turns its result back into its source.
+The molecule is read one element at a time onto a stack,
+and after every element, the top of the stack is matched against
+the results of all the replacements at once, through a trie of
+the results. The first replacement matching the top of the stack
+is undone, and the top is matched again, as what it turned into
+may complete another result. Each element is pushed once and each
+replacement undone once, so a molecule is reduced in time proportional
+to its length, with no copies of it and no recursion.
+
+The molecule can be read from the right as well as from the left,
+by matching the stack against the results written forwards
+instead of backwards.
+
+Replacements of e can only be undone when they are the whole molecule.
+Replacements by a single element never make the molecule shorter,
+and could go round in circles, so they are only undone
+as the very last step, to get back to e.
+
+Undoing the first replacement that matches can lead to a dead end,
+where nothing matches but the molecule is not e yet,
+for example when an element is replaced too soon,
+before the element after it could be read.
+The first tries prefer the longest results, reading from the left
+and then from the right, and every try after that uses a random order
+of preference and a random side instead, starting over from the
+whole molecule, until one of them gets all the way back to e. """
+
+
+import re
+import random
+
+ELEMENT = re.compile(r'e|[A-Z][a-z]?')
+REPLACEMENT = re.compile(r'(\w+) => (\w+)')
+
+# Tries with a random order before giving up
+RESTARTS = 1000
+
+
+def tokenize(molecule):
+    """Split a molecule into its elements"""
+
+    return ELEMENT.findall(molecule)
+
+
+def read_input(f):
+    """Read the replacements, as (source, result), and the molecule"""
+
+    replacements = []
+    molecule = ''
+    for line in f:
+        match = REPLACEMENT.match(line)
+        if match:
+            replacements.append(match.groups())
+        elif line.strip():
+            molecule = line.strip()
+
+    return replacements, molecule
+
+
+class Reducer(object):
+
+    """Undo replacements to get a molecule back to where it started"""
+
+    def __init__(self, replacements):
+        self.numbers = {}
+        self.rules = []
+        # (source, result) of the replacements by a single element
+        self.renames = set()
+        for source, result in replacements:
+            source, result = self.encode(source), self.encode(result)
+            if len(source) != 1:
+                continue
+            if len(result) == 1:
+                self.renames.add((source[0], result[0]))
+            elif result:
+                self.rules.append((source[0], result))
+
+        # Tries of the results, written backwards for reading from the left
+        # and forwards for reading from the right,
+        # with the rules ending at each node under None
+        self.tries = {False: {}, True: {}}
+        for number, (_, result) in enumerate(self.rules):
+            for backwards, trie in self.tries.items():
+                node = trie
+                for element in (result if backwards else reversed(result)):
+                    node = node.setdefault(element, {})
+                node.setdefault(None, []).append(number)
+
+    def encode(self, molecule):
+        """Get the numbers of the elements of a molecule"""
+
+        return [
+            self.numbers.setdefault(element, len(self.numbers))
+            for element in tokenize(molecule)]
+
+    def _matches(self, stack, backwards):
+        """Yield the rules whose result is the top of the stack"""
+
+        node = self.tries[backwards]
+        for depth in range(1, len(stack) + 1):
+            node = node.get(stack[-depth])
+            if node is None:
+                return
+            for number in node.get(None, ()):
+                yield number, depth
+
+    def _reduce(self, elements, start, preference, backwards):
+        """Undo replacements, preferring rules earlier in preference
+
+        Returns the number of replacements undone,
+        or None if it ends anywhere but at start."""
+
+        rank = {number: index for index, number in enumerate(preference)}
+        if backwards:
+            elements = elements[::-1]
+        stack = []
+        steps = 0
+        for position, element in enumerate(elements):
+            stack.append(element)
+            last = position == len(elements) - 1
+
+            while True:
+                # Undoing a replacement of start has to leave only start
+                matches = [
+                    (rank[number], number, depth)
+                    for number, depth in self._matches(stack, backwards)
+                    if self.rules[number][0] != start
+                    or (last and depth == len(stack))]
+                if not matches:
+                    break
+                _, number, depth = min(matches)
+                del stack[-depth:]
+                stack.append(self.rules[number][0])
+                steps += 1
+
+        if stack == [start]:
+            return steps
+        if len(stack) == 1 and (start, stack[0]) in self.renames:
+            return steps + 1
+        return None
+
+    def reduce(self, molecule, start='e', restarts=RESTARTS, seed=None):
+        """Get the replacements from start to the molecule
+
+        Returns None if no try gets back to start."""
+
+        elements = self.encode(molecule)
+        start = self.encode(start)
+        if elements == start:
+            return 0
+        if len(start) != 1:
+            return None
+
+        # Longest results first, from either side
+        preference = sorted(
+            range(len(self.rules)), key=lambda n: -len(self.rules[n][1]))
+        for backwards in (False, True):
+            steps = self._reduce(elements, start[0], preference, backwards)
+            if steps is not None:
+                return steps
+
+        generator = random.Random(seed)
+        for _ in range(restarts):
+            generator.shuffle(preference)
+            steps = self._reduce(
+                elements, start[0], preference, generator.random() < 0.5)
+            if steps is not None:
+                return steps
+
+        return None
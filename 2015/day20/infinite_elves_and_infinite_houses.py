@@ -44,42 +44,20 @@ for a total of 10 + 20 + 40 = 70 presents.
 What is the lowest house number of the house to get at least as many presents
 as the number in your puzzle input? """
 
-# get the target presents to check for
-# divide it by ten to make calculation simpler
-# since each elf drops ten presents at each house
-# so, house 4 has (10 + 20 + 40) = 70
+# every elf drops ten presents at each house it visits,
+# so house 4 has (10 + 20 + 40) = 70
 # which is (1 + 2 + 4) * 10 = 70
-# which can be calculated by using (1 + 2 + 4) = 7
 #
-# the set of presents received by each house
-# is the set of factors (unique) including 1 and house no
-#
-# therefore, by calculating the factors gives us what elves
-# will be dropping presents at that house
+# the elves visiting each house are the factors of its house no,
+# so instead of finding the factors of every house,
+# let every elf drop its presents at the houses it visits,
+# for a block of houses at a time,
+# until a house has at least the target presents
 
 with open('./input.txt', 'r') as f:
-    target_presents = int(f.readline().strip()) // 10
-
-import math
-from itertools import chain
+    target_presents = int(f.readline().strip())
 
-# iterate from 1 to target number of presents
-for house_no in range(1, target_presents):
-    # get the number of presents at this house
-    # number of presents is the sum of all factors of this house no
-    presents = sum(set(
-        # chaining is used to get a single list
-        # from the tuple produced in list comprehension
-        chain.from_iterable(
-            # get the two factors, (x, y) where x * y = house_no
-            (i, house_no // i)
-            # iterate only upto the square root of house_no
-            # as the max factor will be its square root
-            for i in range(1, math.ceil(math.sqrt(house_no) + 1))
-            # check that i being iterate divides house_no completely
-            if house_no % i == 0)))
-    # check if presents for this house are the required no of presents
-    if presents >= target_presents:
-        break
+from sieve import first_house
+house_no = first_house(target_presents, presents=10)
 
 print(house_no)
@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" Presents for every house at once, through a sieve.
+
+Rather than finding the factors of one house after another,
+every elf walks its own houses, adding its presents to each of them,
+just like in the puzzle. Elf e visits n / e of the first n houses,
+so sieving n houses takes n / 1 + n / 2 + ... + n / n,
+which is O(n log n) altogether.
+
+The first house with enough presents is not known in advance,
+so houses are sieved in blocks: from 1 up to a bound, then from there
+up to twice the bound, and so on, until a house in the block has
+enough presents. Only the block being sieved is held in memory,
+so the memory used stays proportional to the answer, and the work
+done on all the blocks is at most about twice that of the last one.
+
+Elves that only visit some houses, like the 50 of part 2,
+stop at their last house, and are skipped entirely in the blocks
+past it.
+
+With numpy, each elf adds its presents to all of its houses in a block
+with a single slice of the block. Elves past the square root of the
+block only visit a few of its houses, so those elves are taken together
+instead, adding to the k-th house of every one of them at once. """
+
+
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Houses in the first block
+FIRST_BLOCK = 1024
+
+
+def house_presents(start, stop, presents=10, visits=None, use_numpy=True):
+    """Get the presents of each house from start up to stop
+
+    Each elf drops presents times its number at each house,
+    and stops after visits houses, if visits is given."""
+
+    size = stop - start
+    use_numpy = use_numpy and numpy is not None
+    if use_numpy:
+        block = numpy.zeros(size, dtype=numpy.int64)
+    else:
+        block = array('q', [0]) * size
+
+    # Elves that stop before the block never reach it
+    first_elf = 1 if visits is None else max(1, -(-start // visits))
+
+    # With numpy, elves from split up only visit a few houses in the block,
+    # so rather than a slice for each of them, they are taken together,
+    # the k-th house of each of them at a time
+    split = max(first_elf, int(stop ** 0.5) + 1) if use_numpy else stop
+
+    for elf in range(first_elf, min(split, stop)):
+        # First and last houses of the elf in the block
+        first = max(-(-start // elf) * elf, elf)
+        last = stop if visits is None else min(stop, elf * visits + 1)
+        if first >= last:
+            continue
+
+        if use_numpy:
+            block[first - start:last - start:elf] += elf
+        else:
+            for house in range(first - start, last - start, elf):
+                block[house] += elf
+
+    if split < stop:
+        most = (stop - 1) // split
+        if visits is not None:
+            most = min(most, visits)
+        for k in range(1, most + 1):
+            # Elves whose k-th house is in the block
+            elves = numpy.arange(
+                max(split, -(-start // k)), (stop - 1) // k + 1,
+                dtype=numpy.int64)
+            # The houses of different elves are all different
+            block[elves * k - start] += elves
+
+    # Every elf drops the same number of presents per elf number
+    if use_numpy:
+        return (block * presents).tolist()
+    return [count * presents for count in block]
+
+
+def first_house(target, presents=10, visits=None, use_numpy=True):
+    """Get the first house with at least target presents"""
+
+    start, stop = 1, FIRST_BLOCK
+    while True:
+        block = house_presents(start, stop, presents, visits, use_numpy)
+        for house, count in enumerate(block, start):
+            if count >= target:
+                return house
+        start, stop = stop, stop * 2
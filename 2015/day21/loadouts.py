@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" Fights worked out in one step, over every loadout from the shop.
+
+Every attack deals the same damage, at least 1,
+so a fighter with hits hit points goes down after
+ceil(hits / damage) attacks, without playing the fight out.
+The player attacks first, so the player wins if the boss
+goes down in as many turns as the player, or fewer.
+
+A loadout is exactly one weapon, at most one armor,
+and at most two different rings, any two of them,
+so two damage rings or two defense rings can be worn together.
+Only the damage and armor of a loadout matter in a fight,
+and many loadouts share them, so the loadouts are sorted by cost
+and gathered by (damage, armor), keeping the cheapest and
+the most expensive of each. This table only depends on the shop,
+and is worked out once for every boss.
+
+The cheapest win and the most expensive loss then come from a single pass
+over the table, with a single fight for each (damage, armor). """
+
+
+from collections import namedtuple
+from functools import lru_cache
+from itertools import combinations
+
+Item = namedtuple('Item', ['name', 'cost', 'damage', 'armor'])
+
+WEAPONS = (
+    Item('Dagger', 8, 4, 0),
+    Item('Shortsword', 10, 5, 0),
+    Item('Warhammer', 25, 6, 0),
+    Item('Longsword', 40, 7, 0),
+    Item('Greataxe', 74, 8, 0),
+)
+
+ARMOR = (
+    Item('Leather', 13, 0, 1),
+    Item('Chainmail', 31, 0, 2),
+    Item('Splintmail', 53, 0, 3),
+    Item('Bandedmail', 75, 0, 4),
+    Item('Platemail', 102, 0, 5),
+)
+
+RINGS = (
+    Item('Damage +1', 25, 1, 0),
+    Item('Damage +2', 50, 2, 0),
+    Item('Damage +3', 100, 3, 0),
+    Item('Defense +1', 20, 0, 1),
+    Item('Defense +2', 40, 0, 2),
+    Item('Defense +3', 80, 0, 3),
+)
+
+# Hit points of the player
+PLAYER_HITS = 100
+
+
+def turns_to_kill(hits, damage, armor):
+    """Get the attacks needed to bring hits down to 0"""
+
+    return -(-hits // max(1, damage - armor))
+
+
+def player_wins(hits, damage, armor, boss_hits, boss_damage, boss_armor):
+    """Check if the player wins the fight, attacking first"""
+
+    return (
+        turns_to_kill(boss_hits, damage, boss_armor)
+        <= turns_to_kill(hits, boss_damage, armor))
+
+
+def loadouts(weapons=WEAPONS, armor=ARMOR, rings=RINGS):
+    """Get every legal loadout, as lists of items, cheapest first"""
+
+    armor_choices = [()] + [(item, ) for item in armor]
+    ring_choices = [
+        pair for count in range(3) for pair in combinations(rings, count)]
+
+    return sorted(
+        (
+            [weapon] + list(worn) + list(pair)
+            for weapon in weapons
+            for worn in armor_choices
+            for pair in ring_choices),
+        key=lambda items: sum(item.cost for item in items))
+
+
+@lru_cache(maxsize=None)
+def stat_table(weapons=WEAPONS, armor=ARMOR, rings=RINGS):
+    """Get the cheapest and most expensive loadouts for each stat
+
+    Returns a dict of (damage, armor): (cheapest, most expensive),
+    where both are (cost, items)."""
+
+    table = {}
+    for items in loadouts(weapons, armor, rings):
+        stats = (
+            sum(item.damage for item in items),
+            sum(item.armor for item in items))
+        loadout = (sum(item.cost for item in items), items)
+        # Sorted by cost, so the first one is the cheapest
+        table[stats] = (table.get(stats, (loadout, ))[0], loadout)
+
+    return table
+
+
+def best_loadouts(boss, hits=PLAYER_HITS, shop=(WEAPONS, ARMOR, RINGS)):
+    """Get the cheapest win and the most expensive loss against boss
+
+    boss is (hits, damage, armor). Both are (cost, items),
+    or None if there are no such loadouts."""
+
+    cheapest_win = most_expensive_loss = None
+    for (damage, armor), (cheapest, priciest) in stat_table(*shop).items():
+        if player_wins(hits, damage, armor, *boss):
+            if cheapest_win is None or cheapest[0] < cheapest_win[0]:
+                cheapest_win = cheapest
+        elif (most_expensive_loss is None
+                or priciest[0] > most_expensive_loss[0]):
+            most_expensive_loss = priciest
+
+    return cheapest_win, most_expensive_loss
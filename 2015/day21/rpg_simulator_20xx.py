@@ -76,230 +76,28 @@ What is the least amount of gold you can spend and still win the fight? """
 
 # LOGIC
 # weapons is non-optional
-# all others are optional, therefore, an extra item is added to each type
-# called None, it has all stats set to 0
-# so that calculating variations will automatically
-# use the None as a case where none of that item-types are bought
-
-# shop items
-weapons = {
-    'Dagger': {
-        'cost': 8,
-        'damage': 4,
-        'armor': 0,
-    },
-    'Shortsword': {
-        'cost': 10,
-        'damage': 5,
-        'armor': 0,
-    },
-    'Warhammer': {
-        'cost': 25,
-        'damage': 6,
-        'armor': 0,
-    },
-    'Longsword': {
-        'cost': 40,
-        'damage': 7,
-        'armor': 0,
-    },
-    'Greataxe': {
-        'cost': 74,
-        'damage': 8,
-        'armor': 0,
-    },
-}
-
-armor = {
-    'None': {
-        'cost': 0,
-        'damage': 0,
-        'armor': 0,
-    },
-    'Leather': {
-        'cost': 13,
-        'damage': 0,
-        'armor': 1,
-    },
-    'Chainmail': {
-        'cost': 31,
-        'damage': 0,
-        'armor': 2,
-    },
-    'Splintmail': {
-        'cost': 53,
-        'damage': 0,
-        'armor': 3,
-    },
-    'Bandedmail': {
-        'cost': 75,
-        'damage': 0,
-        'armor': 4,
-    },
-    'Platemail': {
-        'cost': 102,
-        'damage': 0,
-        'armor': 5,
-    },
-}
-
-rings_damage = {
-    'None': {
-        'cost': 0,
-        'damage': 0,
-        'armor': 0,
-    },
-    'Damage +1': {
-        'cost': 25,
-        'damage': 1,
-        'armor': 0,
-    },
-    'Damage +2': {
-        'cost': 50,
-        'damage': 2,
-        'armor': 0,
-    },
-    'Damage +3': {
-        'cost': 100,
-        'damage': 3,
-        'armor': 0,
-    },
-}
-
-rings_armor = {
-    'None': {
-        'cost': 0,
-        'damage': 0,
-        'armor': 0,
-    },
-    'Defense +1': {
-        'cost': 20,
-        'damage': 0,
-        'armor': 1,
-    },
-    'Defense +2': {
-        'cost': 40,
-        'damage': 0,
-        'armor': 2,
-    },
-    'Defense +3': {
-        'cost': 80,
-        'damage': 0,
-        'armor': 3,
-    },
-}
-
-player = {
-    'hits': 100,
-    'damage': 0,
-    'armor': 0,
-}
+# armor is optional, and so are up to two different rings
+#
+# every attack deals the same damage (at least 1),
+# so the number of turns each fighter lasts is worked out directly,
+# instead of playing out the fight turn by turn.
+# The player attacks first, and wins
+# if the boss goes down in as many turns as the player, or fewer.
+#
+# only the damage and armor of the items matter in the fight,
+# so all loadouts with the same stats are fought once,
+# with the cheapest and most expensive of them.
 
 
 # parse boss stats from input
 import re
 pattern = re.compile(r'(\d+)')
 with open('./input.txt', 'r') as f:
-    # make a dictionary
-    boss = dict(zip(
-        # attach input to stats
-        ('hits', 'damage', 'armor'),
-        [int(pattern.findall(line)[0]) for line in f.readlines()]))
-
-
-def calculate_gold(*items):
-    """Calculate gold for buying given items"""
-
-    # access cost in the item dictionary
-    get_cost = lambda x: x[0][x[1]]['cost']
-
-    # return sum of costs of all items
-    return sum(
-        # get cost of each item
-        map(get_cost,
-            # map items onto their categories
-            zip(
-                (weapons, armor, rings_damage, rings_armor),
-                (*items))))
-
-
-def get_stats(*items):
-    """Get damange and armor stats from given items"""
-
-    # get damage from item dictionary
-    get_damage = lambda x: x[0][x[1]]['damage']
-    # get armor from item dictionary
-    get_armor = lambda x: x[0][x[1]]['armor']
-
-    # map items onto their categories
-    stats = list(zip((weapons, armor, rings_damage, rings_armor), (*items)))
-
-    # get sum of total damage from all items
-    stat_damage = sum(map(get_damage, stats))
-    # get armor of total damage from all items
-    stat_armor = sum(map(get_armor, stats))
-
-    return (stat_damage, stat_armor)
-
-
-def simulate_gameplay(*items):
-    """Simulate gameplay battle for given items
-    Returns outcome and gold spent."""
-
-    # get damage and armor from items
-    p_damage, p_armor = get_stats(*items)
-    # calculate gold used to buy items
-    gold = calculate_gold(*items)
-
-    # player stats
-    p_hits = player['hits']
-    p_damage += player['damage']
-    p_armor += player['armor']
-
-    # boss stats
-    b_hits = boss['hits']
-
-    # amount of hurt dealt to player
-    # minimum damage dealt is 1
-    p_hurt = boss['damage'] - p_armor
-    if p_hurt <= 0:
-        p_hurt = 1
-    # amount of hurt dealt to boss
-    # minimum damage dealt is 1
-    b_hurt = p_damage - boss['armor']
-    if b_hurt <= 0:
-        b_hurt = 1
-
-    # simulate steps until one of the players is dead
-    # minimum number of plays is steps equal to player's hit points
-    # since 1 damage is dealt at each step
-    for i in range(0, player['hits']):
-
-        # player plays
-        b_hits -= b_hurt
-        # check if boss is dead
-        if b_hits <= 0:
-            return (True, gold)
-        # boss plays
-        p_hits -= p_hurt
-        # check if player is dead
-        if p_hits <= 0:
-            return (False, gold)
-
-
-# calculate all variations of items possible
-# uses dictionary keys, which are item names
-# product selects each item from a iterable,
-# and matches it with each item from other lists
-from itertools import product
-variations = product(
-    weapons.keys(), armor.keys(),
-    rings_damage.keys(), rings_armor.keys())
-
-# get results for all variations
-games = [simulate_gameplay(i) for i in variations]
+    # (hits, damage, armor)
+    boss = tuple(int(pattern.findall(line)[0]) for line in f.readlines())
 
-# select outcomes where the player has won
-gold = [gold for outcome, gold in games if outcome is True]
+from loadouts import best_loadouts
+cheapest_win, most_expensive_loss = best_loadouts(boss)
 
-print(min(gold))
+# gold spent on the cheapest loadout where the player has won
+print(cheapest_win[0])
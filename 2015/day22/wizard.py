@@ -0,0 +1,273 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" Least mana to win the wizard fight, through a best-first search.
+
+A state of the fight is a tuple, taken when the player is about to cast:
+
+    (player hp, mana, boss hp, shield timer, poison timer, recharge timer)
+
+Every move is a whole round: the player casts a spell,
+the boss attacks back, and the next player's turn starts,
+so a state is always at the same point of a player's turn,
+and the turn does not need to be kept. A state with the boss
+at 0 hit points or less is a won fight.
+
+The spells are compiled once into a rule table of tuples
+indexed by spell number: the cost, instant damage and healing,
+and the timer of each spell, and what each running effect does
+every turn. The transition from a state and a spell to the next state
+only reads the table and makes the new tuple, without looking up
+spells by name, or changing or copying any game objects.
+
+States are taken from a heap in order of the mana spent
+to reach them, plus a lower bound of the mana still needed:
+no spell deals more damage per mana than poison,
+so the boss hit points left, less what the effects already
+running will deal, can not be dealt with less than that many
+times the mana of poison per damage. The first won fight taken
+from the heap is then the one with the least mana spent (A*).
+
+A state is also skipped if another state, with the same boss hit points
+and timers, was taken before it with at least as many hit points and
+as much mana, since that one can do everything this one can,
+for no more mana.
+
+In hard mode, the player loses drain hit points at the start
+of each of their turns. """
+
+
+import heapq
+from collections import namedtuple
+from fractions import Fraction
+
+Spell = namedtuple(
+    'Spell', ['name', 'cost', 'damage', 'heal', 'armor', 'mana', 'turns'])
+
+# Spells with turns start effects that last that many turns,
+# the others take effect instantly
+SPELLS = (
+    Spell('Magic Missile', 53, 4, 0, 0, 0, 0),
+    Spell('Drain', 73, 2, 2, 0, 0, 0),
+    Spell('Shield', 113, 0, 0, 7, 0, 6),
+    Spell('Poison', 173, 3, 0, 0, 0, 6),
+    Spell('Recharge', 229, 0, 0, 0, 101, 5),
+)
+
+# Effects that can run at the same time, one timer each in a state
+TIMERS = 3
+
+PLAYER_HP = 50
+PLAYER_MANA = 500
+
+Rules = namedtuple('Rules', [
+    # by spell number
+    'costs', 'damages', 'heals', 'slots', 'turns',
+    # by timer slot
+    'effect_damages', 'effect_manas', 'effect_armors'])
+
+
+def compile_spells(spells=SPELLS):
+    """Compile spells into a table of rules
+
+    Every spell starting an effect gets the next timer slot,
+    the other spells have a slot of -1."""
+
+    effects = [spell for spell in spells if spell.turns]
+    if len(effects) != TIMERS:
+        raise ValueError(
+            'expected {timers} effects, got {count}'.format(
+                timers=TIMERS, count=len(effects)))
+
+    return Rules(
+        costs=tuple(spell.cost for spell in spells),
+        damages=tuple(0 if spell.turns else spell.damage for spell in spells),
+        heals=tuple(spell.heal for spell in spells),
+        slots=tuple(
+            effects.index(spell) if spell.turns else -1 for spell in spells),
+        turns=tuple(spell.turns for spell in spells),
+        effect_damages=tuple(effect.damage for effect in effects),
+        effect_manas=tuple(effect.mana for effect in effects),
+        effect_armors=tuple(effect.armor for effect in effects))
+
+
+def start_state(boss_hp, hp=PLAYER_HP, mana=PLAYER_MANA, drain=0):
+    """Get the state of the first turn, or None if it is already lost"""
+
+    if hp - drain <= 0:
+        return None
+    return (hp - drain, mana, boss_hp) + (0, ) * TIMERS
+
+
+def make_transition(boss_damage, drain=0, spells=SPELLS):
+    """Make the transition function of a fight
+
+    transition(state, spell) casts spell number spell from state,
+    and returns the state of the next turn,
+    or None if the spell can not be cast or the player loses."""
+
+    rules = compile_spells(spells)
+    costs, damages, heals, slots, turns = rules[:5]
+    damage_0, damage_1, damage_2 = rules.effect_damages
+    mana_0, mana_1, mana_2 = rules.effect_manas
+    armor_0, armor_1, armor_2 = rules.effect_armors
+
+    def transition(state, spell):
+        hp, mana, boss_hp, timer_0, timer_1, timer_2 = state
+
+        # Player's turn: cast the spell
+        cost = costs[spell]
+        if cost > mana:
+            return None
+        mana -= cost
+        slot = slots[spell]
+        # Effects can not be cast again while they are running
+        if slot == 0:
+            if timer_0:
+                return None
+            timer_0 = turns[spell]
+        elif slot == 1:
+            if timer_1:
+                return None
+            timer_1 = turns[spell]
+        elif slot == 2:
+            if timer_2:
+                return None
+            timer_2 = turns[spell]
+        else:
+            hp += heals[spell]
+            boss_hp -= damages[spell]
+            if boss_hp <= 0:
+                return hp, mana, boss_hp, timer_0, timer_1, timer_2
+
+        # Boss's turn: effects, then the attack
+        armor = 0
+        if timer_0:
+            timer_0 -= 1
+            boss_hp -= damage_0
+            mana += mana_0
+            armor += armor_0
+        if timer_1:
+            timer_1 -= 1
+            boss_hp -= damage_1
+            mana += mana_1
+            armor += armor_1
+        if timer_2:
+            timer_2 -= 1
+            boss_hp -= damage_2
+            mana += mana_2
+            armor += armor_2
+        if boss_hp <= 0:
+            return hp, mana, boss_hp, timer_0, timer_1, timer_2
+        hp -= max(boss_damage - armor, 1)
+
+        # Start of the next player's turn: drain, then effects
+        hp -= drain
+        if hp <= 0:
+            return None
+        if timer_0:
+            timer_0 -= 1
+            boss_hp -= damage_0
+            mana += mana_0
+        if timer_1:
+            timer_1 -= 1
+            boss_hp -= damage_1
+            mana += mana_1
+        if timer_2:
+            timer_2 -= 1
+            boss_hp -= damage_2
+            mana += mana_2
+
+        return hp, mana, boss_hp, timer_0, timer_1, timer_2
+
+    return transition
+
+
+def least_mana(
+        boss_hp, boss_damage, hp=PLAYER_HP, mana=PLAYER_MANA, drain=0,
+        spells=SPELLS):
+    """Get the least mana spent to win the fight, or None if it can't be won
+
+    drain is the hit points lost at the start of each player's turn,
+    1 in hard mode."""
+
+    rules = compile_spells(spells)
+    transition = make_transition(boss_damage, drain, spells)
+    costs, effect_damages = rules.costs, rules.effect_damages
+
+    # The least mana per damage of any spell,
+    # counting every turn of the effects
+    per_damage = min(
+        Fraction(cost, dealt)
+        for cost, dealt in zip(costs, [
+            effect_damages[slot] * turns if slot >= 0 else damage
+            for damage, slot, turns in zip(
+                rules.damages, rules.slots, rules.turns)])
+        if dealt)
+
+    def estimate(state):
+        """Get a lower bound of the mana still needed to win"""
+
+        # What the running effects will still deal is free
+        left = state[2] - sum(
+            damage * timer for damage, timer in zip(effect_damages, state[3:]))
+        return -(
+            -max(left, 0) * per_damage.numerator // per_damage.denominator)
+
+    start = start_state(boss_hp, hp, mana, drain)
+    if start is None:
+        return None
+    heap = [(estimate(start), 0, start)]
+    # (boss hp, timers) -> [(hp, mana)] of the states taken so far
+    taken = {}
+    spell_numbers = range(len(spells))
+
+    while heap:
+        _, spent, state = heapq.heappop(heap)
+        if state[2] <= 0:
+            return spent
+
+        seen = taken.setdefault(state[2:], [])
+        if any(h >= state[0] and m >= state[1] for h, m in seen):
+            continue
+        seen.append(state[:2])
+
+        for spell in spell_numbers:
+            next_state = transition(state, spell)
+            if next_state is not None:
+                cost = spent + costs[spell]
+                heapq.heappush(
+                    heap, (cost + estimate(next_state), cost, next_state))
+
+    return None
+
+
+def benchmark(boss_hp=55, boss_damage=8, drain=0, limit=200000):
+    """Print the states expanded per second by the transition function"""
+
+    from timeit import default_timer
+
+    transition = make_transition(boss_damage, drain)
+    spell_numbers = range(len(SPELLS))
+
+    # Expand the states reachable from the start, breadth first
+    states = [start_state(boss_hp, drain=drain)]
+    expanded = 0
+    start = default_timer()
+    while states and expanded < limit:
+        next_states = []
+        for state in states:
+            expanded += 1
+            for spell in spell_numbers:
+                next_state = transition(state, spell)
+                if next_state is not None and next_state[2] > 0:
+                    next_states.append(next_state)
+        states = next_states
+    elapsed = default_timer() - start
+    print('{expanded} states expanded, {rate:.0f} states/s'.format(
+        expanded=expanded, rate=expanded / elapsed))
+
+
+if __name__ == '__main__':
+
+    benchmark()
@@ -0,0 +1,302 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" Decoded and compiled programs for Jane Marie's computer.
+
+The program is decoded once, before it runs: each instruction
+becomes a tuple of (opcode, register, target), where the opcode is
+a number, the register is its slot in a list of registers,
+and jumps have the absolute position they go to, instead of an offset.
+Running the program is then a loop over those tuples,
+without looking up instruction names or registers in a dict.
+
+The program can also be compiled into a Python function,
+which is run with exec. The program is split into blocks that start
+at every jump target, and after every jump, so that within a block the
+instructions run straight through. Each register is a local variable,
+and every instruction is a single statement.
+Rather than stopping at the end of a block, the code of each block
+carries on with the code of the blocks it goes on to, until one of them
+comes round again. Only then does it set the position of the next block,
+which is found by a tree of comparisons on the block positions,
+so most jumps in a loop never leave the straight code. """
+
+
+import re
+from collections import namedtuple
+
+# opcodes
+HLF = 0
+TPL = 1
+INC = 2
+JMP = 3
+JIE = 4
+JIO = 5
+
+OPCODES = {
+    'hlf': HLF,
+    'tpl': TPL,
+    'inc': INC,
+    'jmp': JMP,
+    'jie': JIE,
+    'jio': JIO,
+}
+
+INSTRUCTION = re.compile(r'(\w+) (?:(\w+)(?:, )?)?([+-]\d+)?$')
+
+# Python statements and conditions of the compiled instructions
+STATEMENTS = {
+    HLF: '{register} //= 2',
+    TPL: '{register} *= 3',
+    INC: '{register} += 1',
+}
+CONDITIONS = {
+    JIE: 'not {register} % 2',
+    JIO: '{register} == 1',
+}
+
+# Most lines of code to follow from a block into the blocks after it
+TRACE_LIMIT = 200
+
+# A decoded program, with the names of the registers by slot
+Program = namedtuple('Program', ['code', 'registers'])
+
+
+def read_program(lines):
+    """Read lines of instructions, as (name, register, offset)
+
+    register and offset are None for instructions without them."""
+
+    instructions = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        match = INSTRUCTION.match(line)
+        if match is None or match.group(1) not in OPCODES:
+            raise ValueError('invalid instruction {line!r}'.format(line=line))
+        name, register, offset = match.groups()
+        instructions.append(
+            (name, register, int(offset) if offset is not None else None))
+
+    return instructions
+
+
+def decode(instructions, registers=('a', 'b')):
+    """Decode instructions into a Program of (opcode, slot, target)
+
+    Slots of the registers start with those in registers,
+    followed by any others used by the instructions."""
+
+    names = list(registers)
+    code = []
+    for position, (name, register, offset) in enumerate(instructions):
+        if register is not None and register not in names:
+            names.append(register)
+        slot = names.index(register) if register is not None else -1
+        target = position + offset if offset is not None else -1
+        code.append((OPCODES[name], slot, target))
+
+    return Program(tuple(code), tuple(names))
+
+
+def run_program(program, registers):
+    """Run a decoded program on a list of registers, by slot"""
+
+    code = program.code
+    size = len(code)
+    position = 0
+    while 0 <= position < size:
+        opcode, slot, target = code[position]
+        if opcode == INC:
+            registers[slot] += 1
+        elif opcode == TPL:
+            registers[slot] *= 3
+        elif opcode == HLF:
+            registers[slot] //= 2
+        elif opcode == JMP:
+            position = target
+            continue
+        elif opcode == JIE:
+            if not registers[slot] % 2:
+                position = target
+                continue
+        elif registers[slot] == 1:
+            position = target
+            continue
+        position += 1
+
+    return registers
+
+
+def _dispatch(blocks, indent):
+    """Yield the lines of a tree of comparisons, running the block at pc"""
+
+    if len(blocks) == 1:
+        for line in blocks[0][1]:
+            yield indent + line
+        return
+
+    middle = len(blocks) // 2
+    yield indent + 'if pc < {start}:'.format(start=blocks[middle][0])
+    yield from _dispatch(blocks[:middle], indent + '    ')
+    yield indent + 'else:'
+    yield from _dispatch(blocks[middle:], indent + '    ')
+
+
+def program_source(program, trace_limit=TRACE_LIMIT):
+    """Get the source of a Python function running the program
+
+    The function takes a list of registers by slot,
+    and returns it with their values at the end."""
+
+    code = program.code
+    size = len(code)
+    names = ['r{slot}'.format(slot=slot) for slot in range(
+        len(program.registers))]
+    done = 'return [{names}]'.format(names=', '.join(names))
+
+    # Blocks start at the beginning, at every jump target,
+    # and after every jump
+    starts = {0}
+    for position, (opcode, _, target) in enumerate(code):
+        if opcode >= JMP:
+            starts.add(position + 1)
+            starts.add(target)
+    starts = sorted(start for start in starts if 0 <= start < size)
+    ends = dict(zip(starts, starts[1:] + [size]))
+
+    def goto(target):
+        """Get the lines jumping to target, or leaving the program"""
+
+        if 0 <= target < size:
+            return ['pc = {target}'.format(target=target), 'continue']
+        return [done]
+
+    blocks = []
+    for start in starts:
+        # Follow the block into the blocks after it,
+        # until one of them comes round again
+        lines = []
+        seen = set()
+        position = start
+        while True:
+            if not 0 <= position < size:
+                lines.append(done)
+                break
+            if position in seen or len(lines) > trace_limit:
+                lines.extend(goto(position))
+                break
+            seen.add(position)
+
+            for opcode, slot, target in code[position:ends[position]]:
+                register = names[slot] if slot >= 0 else None
+                if opcode < JMP:
+                    lines.append(STATEMENTS[opcode].format(register=register))
+                elif opcode != JMP:
+                    lines.append('if {condition}:'.format(
+                        condition=CONDITIONS[opcode].format(
+                            register=register)))
+                    lines.extend('    ' + line for line in goto(target))
+
+            # Carry on where the block jumps to, or after it
+            opcode, _, target = code[ends[position] - 1]
+            position = target if opcode == JMP else ends[position]
+
+        blocks.append((start, lines))
+
+    source = ['def program(registers):']
+    source.append('    {names} = registers'.format(
+        names=', '.join(names) + ','))
+    if blocks:
+        source.append('    pc = 0')
+        source.append('    while True:')
+        source.extend(_dispatch(blocks, ' ' * 8))
+    source.append('    ' + done)
+
+    return '\n'.join(source) + '\n'
+
+
+def compile_program(program):
+    """Compile a decoded program into a Python function, with exec"""
+
+    namespace = {}
+    exec(compile(program_source(program), '<program>', 'exec'), namespace)
+    return namespace['program']
+
+
+def execute(instructions, registers=None, compiled=False):
+    """Run instructions, and get the registers at the end
+
+    registers is a dict of the values of the registers at the start,
+    the others start at 0."""
+
+    registers = registers or {'a': 0, 'b': 0}
+    program = decode(instructions, tuple(registers))
+    values = [registers.get(name, 0) for name in program.registers]
+
+    if compiled:
+        values = compile_program(program)(values)
+    else:
+        values = run_program(program, values)
+
+    return dict(zip(program.registers, values))
+
+
+# Collatz steps of a, counted in b
+COLLATZ = (
+    'jio a, +8',
+    'inc b',
+    'jie a, +4',
+    'tpl a',
+    'inc a',
+    'jmp +2',
+    'hlf a',
+    'jmp -7',
+)
+
+
+def benchmark(starts=range(1, 20001)):
+    """Print the time to count Collatz steps with each way of running"""
+
+    from timeit import default_timer
+
+    instructions = read_program(COLLATZ)
+
+    # Instructions as (name, args), looked up by name every step
+    def interpret(registers):
+        operations = {
+            'hlf': lambda x: x // 2,
+            'tpl': lambda x: x * 3,
+            'inc': lambda x: x + 1,
+        }
+        position = 0
+        while position < len(instructions):
+            name, register, offset = instructions[position]
+            if name in operations.keys():
+                registers[register] = operations[name](registers[register])
+                position += 1
+            elif name == 'jmp':
+                position += offset
+            elif name == 'jie':
+                position += offset if registers[register] % 2 == 0 else 1
+            else:
+                position += offset if registers[register] == 1 else 1
+        return registers
+
+    program = decode(instructions)
+    function = compile_program(program)
+    for name, run in (
+            ('interpreted', lambda a: interpret({'a': a, 'b': 0})['b']),
+            ('decoded', lambda a: run_program(program, [a, 0])[1]),
+            ('compiled', lambda a: function([a, 0])[1])):
+        start = default_timer()
+        steps = sum(run(a) for a in starts)
+        elapsed = default_timer() - start
+        print('{name}: {steps} steps, {elapsed:.3f}s'.format(
+            name=name, steps=steps, elapsed=elapsed))
+
+
+if __name__ == '__main__':
+
+    benchmark()
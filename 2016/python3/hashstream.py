@@ -0,0 +1,207 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+""" Salted MD5 hash streams shared by the 2016 notebooks.
+
+Day 5 and Day 14 hash a salt followed by an increasing index,
+and Day 17 hashes a passcode followed by the path taken so far.
+
+salted_hashes yields (index, hash) for increasing indexes,
+optionally computing batches of hashes ahead in a process pool.
+HashStream gives random access to the hashes within a sliding window,
+so that looking ahead never hashes the same index twice.
+
+For Day 14, hashes can be stretched by hashing the hex hash again
+a number of times, and one_time_pad_keys finds the keys
+from the triples and quintuples of each hash, which the workers
+work out once per hash alongside the hashing. """
+
+
+import hashlib
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count
+
+# Hashes computed by a worker in one go
+BATCH_SIZE = 1000
+
+# First character repeating three times, and every one repeating five times
+TRIPLE = re.compile(r'(.)\1{2}')
+QUINTUPLE = re.compile(r'(.)\1{4}')
+
+
+def md5_hex(string):
+    """Calculate the MD5 hash of string as lowercase hexadecimal"""
+
+    return hashlib.md5(string.encode('ascii')).hexdigest()
+
+
+def hash_batch(salt, start, stop, stretch=0):
+    """Calculate the hashes of salt + index for index in [start, stop)
+
+    Each hash is stretched by hashing its hex digest stretch more times."""
+
+    # Hash the salt once,
+    # and for each index copy that state and add only its digits.
+    prefix = hashlib.md5(salt.encode('ascii'))
+    md5 = hashlib.md5
+    hashes = []
+    for index in range(start, stop):
+        digest = prefix.copy()
+        digest.update(b'%d' % index)
+        hexdigest = digest.hexdigest()
+        if stretch:
+            # Stay in bytes between rounds of stretching
+            hexbytes = hexdigest.encode('ascii')
+            for _ in range(stretch):
+                hexbytes = md5(hexbytes).hexdigest().encode('ascii')
+            hexdigest = hexbytes.decode('ascii')
+        hashes.append(hexdigest)
+
+    return hashes
+
+
+def key_features(hashstring):
+    """Get the first tripled character, and the set of quintupled ones"""
+
+    triple = TRIPLE.search(hashstring)
+    if triple is None:
+        # No triple means there can not be any quintuples either
+        return None, frozenset()
+
+    return triple.group(1), frozenset(QUINTUPLE.findall(hashstring))
+
+
+def feature_batch(salt, start, stop, stretch=0):
+    """Calculate key_features of the hashes for index in [start, stop)"""
+
+    return [
+        key_features(hashstring)
+        for hashstring in hash_batch(salt, start, stop, stretch)]
+
+
+def _batches(batch, salt, start, stretch, workers, batch_size):
+    """Yield (index, result) from consecutive batches starting at start
+
+    With workers, batches are computed in a process pool,
+    keeping one batch per worker in flight ahead of the one being yielded.
+    Batches are always yielded in order of index."""
+
+    if not workers:
+        for batch_start in count(start, batch_size):
+            yield from enumerate(
+                batch(salt, batch_start, batch_start + batch_size, stretch),
+                batch_start)
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    batches = deque()
+    next_start = start
+    try:
+        while True:
+            while len(batches) <= workers:
+                future = executor.submit(
+                    batch, salt, next_start, next_start + batch_size, stretch)
+                batches.append((next_start, future))
+                next_start += batch_size
+
+            batch_start, future = batches.popleft()
+            yield from enumerate(future.result(), batch_start)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def salted_hashes(
+        salt, start=0, stretch=0, workers=None, batch_size=BATCH_SIZE):
+    """Yield (index, hash) of salt + index for index from start onwards"""
+
+    return _batches(hash_batch, salt, start, stretch, workers, batch_size)
+
+
+def one_time_pad_keys(
+        salt, stretch=0, lookahead=1000, workers=None, batch_size=BATCH_SIZE):
+    """Yield the indexes of one-time pad keys in increasing order
+
+    An index is a key if its hash has a triple of some character,
+    and one of the next lookahead hashes has a quintuple of it.
+
+    The features of the current index and the lookahead after it
+    are kept in a ring buffer, along with a count for every character
+    of the hashes in the lookahead that have a quintuple of it.
+    Moving to the next index drops the current one from the counts,
+    and adds the one entering the window in its slot of the ring,
+    so checking an index for a key is a single lookup."""
+
+    features = _batches(
+        feature_batch, salt, 0, stretch, workers, batch_size)
+    size = lookahead + 1
+    ring = [None] * size
+    quintuple_counts = dict.fromkeys('0123456789abcdef', 0)
+
+    try:
+        # Fill the ring with indexes 0 to lookahead
+        for _ in range(size):
+            index, (triple, quintuples) = next(features)
+            ring[index % size] = triple, quintuples
+            for character in quintuples:
+                quintuple_counts[character] += 1
+
+        for index in count():
+            # Leave only the next lookahead hashes in the counts
+            triple, quintuples = ring[index % size]
+            for character in quintuples:
+                quintuple_counts[character] -= 1
+
+            if triple is not None and quintuple_counts[triple]:
+                yield index
+
+            # Bring the next index into the slot that was just freed
+            new_index, (new_triple, new_quintuples) = next(features)
+            ring[new_index % size] = new_triple, new_quintuples
+            for character in new_quintuples:
+                quintuple_counts[character] += 1
+    finally:
+        features.close()
+
+
+class HashStream(object):
+
+    """Random access to salted hashes within a sliding window
+
+    Hashes are kept from the lowest index in the window
+    up to the highest index asked for so far.
+    Asking for a higher index pulls hashes from the stream,
+    and the window is a bounded deque, so hashes falling out of it
+    are evicted from the front in O(1)."""
+
+    def __init__(
+            self, salt, window=1001, stretch=0,
+            workers=None, batch_size=BATCH_SIZE):
+        # hashes in the window, the last one is for index end - 1
+        self.hashes = deque(maxlen=window)
+        # index of the next hash to be pulled from the stream
+        self.end = 0
+        # stream of (index, hash)
+        self.stream = salted_hashes(
+            salt, stretch=stretch, workers=workers, batch_size=batch_size)
+
+    def __getitem__(self, index):
+        # Pull hashes from the stream until the index is covered
+        while index >= self.end:
+            _, hashstring = next(self.stream)
+            self.hashes.append(hashstring)
+            self.end += 1
+
+        # Indexes before the window have been evicted
+        offset = index - (self.end - len(self.hashes))
+        if offset < 0:
+            raise IndexError(
+                'hash for index {index} has left the window'.format(
+                    index=index))
+
+        return self.hashes[offset]
+
+    def close(self):
+        """Stop the stream, along with any workers"""
+
+        self.stream.close()